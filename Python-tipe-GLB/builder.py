@@ -3,11 +3,33 @@ Build script for creating standalone executables
 Creates .exe for Windows and .app for macOS
 """
 
-import PyInstaller.__main__
+import PyInstaller  # noqa: F401 - fail early if PyInstaller is missing
+import importlib.util
+import os
+import shutil
+import subprocess
 import sys
 import platform
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# --onedir avoids unpacking the whole bundle to a temp dir on every launch.
+# Set BUILD_ONEFILE=1 to get a single self-extracting executable instead.
+ONEFILE = os.environ.get('BUILD_ONEFILE', '') not in ('', '0')
+
+def run_pyinstaller(args, label):
+    """Run one PyInstaller build in its own process with a private config dir"""
+    # A separate PYINSTALLER_CONFIG_DIR keeps parallel builds from sharing
+    # (and corrupting) the same bincache
+    config_dir = tempfile.mkdtemp(prefix=f'pyi-{label}-')
+    env = {**os.environ, 'PYINSTALLER_CONFIG_DIR': config_dir}
+    try:
+        subprocess.run([sys.executable, '-m', 'PyInstaller', *args], env=env, check=True)
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+
 def build_viewer_exe():
     """Build the 3D viewer executable"""
     
@@ -19,16 +41,70 @@ def build_viewer_exe():
     print(f"Platform: {system}")
     print(f"Python: {sys.version}")
     
-    # Common options
-    common_args = [
+    bundle_mode = '--onefile' if ONEFILE else '--onedir'
+    
+    # Modules never used at runtime (tests, docs, notebooks, data science stack)
+    slim_args = [
+        '--exclude-module=tkinter.test',
+        '--exclude-module=test',
+        '--exclude-module=unittest',
+        '--exclude-module=pydoc_data',
+        '--exclude-module=pygments',
+        '--exclude-module=IPython',
+        '--exclude-module=matplotlib',
+        '--exclude-module=scipy',
+        '--exclude-module=jupyter',
+        '--exclude-module=notebook',
+        '--exclude-module=pandas',
+        '--exclude-module=numpy.tests',
+        '--exclude-module=numpy.f2py',
+    ]
+    
+    # Strip debug symbols from bundled binaries (not recommended on Windows)
+    if system != 'Windows':
+        slim_args.append('--strip')
+    
+    # No UPX: compressed DLLs/SOs would be unpacked in memory on every start
+    slim_args.append('--noupx')
+    
+    # Optional fast JSON backend for the GUI config, bundled only if installed
+    has_orjson = importlib.util.find_spec('orjson') is not None
+    
+    # GUI: only what the launcher itself imports (pyglet lives in the engine)
+    gui_args = [
         'viewer-glb-gui.py',
         '--name=3D_Viewer_Pro',
-        '--onefile',
+        bundle_mode,
         '--windowed',  # No console window
         '--icon=icon.ico' if Path('icon.ico').exists() else '',
         
-        # Include the viewer script
-        '--add-data=viewer-glb.py:.',
+        # Freeze modules as -OO bytecode (smaller PYZ, less to read at import)
+        '--optimize=2',
+        
+        # Hidden imports (libraries not auto-detected)
+        '--hidden-import=customtkinter',
+        '--hidden-import=trimesh',
+        '--hidden-import=PIL._tkinter_finder',
+        '--hidden-import=orjson' if has_orjson else '',
+        
+        # Keep the rendering stack and unused packages out of the GUI
+        '--exclude-module=pyglet',
+        *slim_args,
+        
+        # Cleanup
+        '--clean',
+        '--noconfirm',
+    ]
+    
+    # Engine: the pyglet viewer, launched by the GUI. It stays a console app so
+    # stdout reaches the GUI's pipe; the GUI starts it with CREATE_NO_WINDOW on
+    # Windows, so no console window opens
+    engine_args = [
+        'viewer-glb.py',
+        '--name=3D_Viewer_Engine',
+        bundle_mode,
+        '--icon=icon.ico' if Path('icon.ico').exists() else '',
+        '--optimize=2',
         
         # Hidden imports (libraries not auto-detected)
         '--hidden-import=pyglet',
@@ -38,9 +114,10 @@ def build_viewer_exe():
         '--hidden-import=pyglet.math',
         '--hidden-import=trimesh',
         '--hidden-import=numpy',
-        '--hidden-import=customtkinter',
         '--hidden-import=PIL',
-        '--hidden-import=PIL._tkinter_finder',
+        
+        # Drop unused packages and debug symbols
+        *slim_args,
         
         # Cleanup
         '--clean',
@@ -48,28 +125,41 @@ def build_viewer_exe():
     ]
     
     # Remove empty strings
-    common_args = [arg for arg in common_args if arg]
+    gui_args = [arg for arg in gui_args if arg]
+    engine_args = [arg for arg in engine_args if arg]
     
     # Platform-specific
     if system == 'Windows':
-        print("\nBuilding Windows executable...")
-        PyInstaller.__main__.run(common_args)
+        print("\nBuilding Windows executables...")
         
     elif system == 'Darwin':  # macOS
         print("\nBuilding macOS application...")
-        mac_args = common_args + [
+        gui_args += [
             '--osx-bundle-identifier=com.3dviewer.pro',
         ]
-        PyInstaller.__main__.run(mac_args)
     
     else:  # Linux
-        print("\nBuilding Linux executable...")
-        PyInstaller.__main__.run(common_args)
+        print("\nBuilding Linux executables...")
+    
+    # GUI and engine are independent specs: build them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        builds = [
+            pool.submit(run_pyinstaller, gui_args, 'gui'),
+            pool.submit(run_pyinstaller, engine_args, 'engine'),
+        ]
+        for build in builds:
+            build.result()
     
     print("\n" + "="*70)
     print("✓ Build complete!")
     print("="*70)
-    print(f"\nExecutable location: dist/3D_Viewer_Pro{'.exe' if system=='Windows' else ''}")
+    if ONEFILE:
+        print(f"\nExecutable location: dist/3D_Viewer_Pro{'.exe' if system=='Windows' else ''}")
+    elif system == 'Darwin':
+        print("\nApplication location: dist/3D_Viewer_Pro.app")
+    else:
+        print("\nApplication folder: dist/3D_Viewer_Pro/")
+    print(f"Viewer engine: dist/3D_Viewer_Engine{'' if ONEFILE else '/'}")
     print("\nYou can distribute the entire 'dist' folder.")
     print("Users don't need Python installed!")
 
@@ -4,6 +4,7 @@ CustomTkinter version with integrated terminal and better layout
 """
 
 import customtkinter as ctk
+import tkinter as tk
 from tkinter import filedialog, messagebox
 import subprocess
 import sys
@@ -11,31 +12,507 @@ import json
 import threading
 from pathlib import Path
 from datetime import datetime
-import trimesh
+import importlib.util
 import os
 import queue
+import tempfile
+import time
+import codecs
+import re
+import shlex
+import shutil
+import signal
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import groupby
+from operator import itemgetter
+
+# Config (de)serialization: orjson when available, stdlib json otherwise
+try:
+    import orjson
+    
+    def dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    load_json = orjson.loads
+except ImportError:
+    def dump_json(obj):
+        return json.dumps(obj, indent=2).encode()
+    
+    load_json = json.loads
 
 # Set appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Log colors (terminal text tags are named after these)
+COLOR_DEFAULT = "#E0E0E0"
+COLOR_OK = "#4CAF50"
+COLOR_SUCCESS = "#81C784"
+COLOR_INFO = "#90CAF9"
+COLOR_WARNING = "#FF9800"
+COLOR_ERROR = "#EF5350"
 
-class InteractiveTerminal(ctk.CTkToplevel):
-    """Interactive terminal window with input capability"""
+# Viewers run in their own process group/session, so Ctrl+C or signals aimed
+# at the GUI don't take a running viewer down with it. On Windows they also get
+# no console window (the engine is a console exe; output goes to our pipe)
+if os.name == 'nt':
+    VIEWER_POPEN_FLAGS = {
+        'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW
+    }
+else:
+    VIEWER_POPEN_FLAGS = {'start_new_session': True}
+
+# Viewer output is read as raw bytes and decoded as UTF-8 on our side
+VIEWER_POPEN_FLAGS['env'] = {**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+
+def stop_process_group(process, timeout=2):
+    """Stop a viewer and anything it spawned, killing it if it doesn't exit in time"""
+    try:
+        if os.name == 'nt':
+            # No shared console for CTRL_BREAK: ask the tree's windows to close
+            taskkill_tree(process, force=False)
+        else:
+            os.killpg(os.getpgid(process.pid), signal.SIGTERM)
+        process.wait(timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        if os.name == 'nt':
+            taskkill_tree(process, force=True)
+            process.kill()
+        else:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+def taskkill_tree(process, force):
+    """Windows: close (or with force, terminate) a process and its children"""
+    try:
+        subprocess.run(
+            ['taskkill', '/PID', str(process.pid), '/T'] + (['/F'] if force else []),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NO_WINDOW, timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+
+# Viewer output coloring: one compiled, case-insensitive match per line. The
+# branches keep the priority error/failed > warning > success/loaded, and the
+# group that matched selects the color.
+VIEWER_LINE_CLASSES = re.compile(
+    r'(?=.*(error|failed))|(?=.*(warning))|(?=.*(success|loaded))',
+    re.IGNORECASE
+)
+VIEWER_LINE_COLORS = (None, COLOR_ERROR, COLOR_WARNING, COLOR_SUCCESS)
+
+# Upper bound per pipe read: a burst of output is taken in one syscall
+VIEWER_READ_SIZE = 65536
+
+
+# Characters that need a shell (pipes, redirection, variables, globbing, ...)
+if os.name == 'nt':
+    SHELL_METACHARS = frozenset('|&<>()^%!"\n')
+else:
+    SHELL_METACHARS = frozenset('|&;<>()$`\\*?[]{}~!#\n')
+
+
+def direct_command_args(command):
+    """argv to run a command without a shell, or None if it needs one"""
+    if any(char in SHELL_METACHARS for char in command):
+        return None
+    try:
+        # Windows commands above have no quotes left, so a plain split is exact
+        args = command.split() if os.name == 'nt' else shlex.split(command)
+    except ValueError:
+        return None
+    # Shell builtins (dir, echo on Windows, ...) and VAR=value prefixes
+    # are not programs on PATH
+    if not args or '=' in args[0] or shutil.which(args[0]) is None:
+        return None
+    return args
+
+
+def safe_stat(path):
+    """os.stat() that returns None instead of raising (one syscall, no exists() first)"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def partial_output_path(output_path):
+    """Temp file a GLB is written to before it replaces output_path"""
+    return output_path + '.part'
+
+
+def remove_partial_output(output_path):
+    """Delete the GLB left half-written by a failed or stopped conversion"""
+    try:
+        os.unlink(partial_output_path(output_path))
+    except OSError:
+        pass
+
+
+def export_quantized_glb(mesh):
+    """
+    Export a trimesh.Trimesh as GLB bytes using KHR_mesh_quantization:
+    int16 positions (dequantized by the node scale/translation) and int8
+    normals. UVs stay float32 - trimesh's loader (used by the viewer) does
+    not apply accessor normalization, so normalized uint16 UVs would break
+    texturing there.
+    """
+    import io
+    import struct
+    import numpy as np
     
-    def __init__(self, parent):
+    buffers = []
+    buffer_views = []
+    accessors = []
+    offset = 0
+    
+    def add_view(data, target=None, stride=None):
+        nonlocal offset
+        data = data.tobytes()
+        view = {"buffer": 0, "byteOffset": offset, "byteLength": len(data)}
+        if target is not None:
+            view["target"] = target
+        if stride is not None:
+            view["byteStride"] = stride
+        buffer_views.append(view)
+        # Keep every view 4-byte aligned
+        padding = -len(data) % 4
+        buffers.append(data + b"\x00" * padding)
+        offset += len(data) + padding
+        return len(buffer_views) - 1
+    
+    def add_accessor(view, component_type, count, acc_type, **extra):
+        accessors.append({
+            "bufferView": view,
+            "componentType": component_type,
+            "count": count,
+            "type": acc_type,
+            **extra
+        })
+        return len(accessors) - 1
+    
+    vertices = np.asarray(mesh.vertices, dtype=np.float64)
+    faces = np.asarray(mesh.faces)
+    count = len(vertices)
+    
+    # Positions: center on the bounding box, uniform scale into int16 range.
+    # Vertex attributes must be 4-byte aligned, so VEC3 int16 gets a pad lane.
+    lo, hi = vertices.min(axis=0), vertices.max(axis=0)
+    center = (lo + hi) / 2
+    half = float((hi - lo).max()) / 2 or 1.0
+    quant = np.zeros((count, 4), dtype=np.int16)
+    quant[:, :3] = np.round((vertices - center) / half * 32767)
+    position = add_accessor(
+        add_view(quant, target=34962, stride=8), 5122, count, "VEC3",
+        min=quant[:, :3].min(axis=0).tolist(),
+        max=quant[:, :3].max(axis=0).tolist()
+    )
+    attributes = {"POSITION": position}
+    
+    # Normals: normalized int8 with a pad lane
+    normals = np.zeros((count, 4), dtype=np.int8)
+    normals[:, :3] = np.round(np.clip(mesh.vertex_normals, -1, 1) * 127)
+    attributes["NORMAL"] = add_accessor(
+        add_view(normals, target=34962, stride=4), 5120, count, "VEC3",
+        normalized=True
+    )
+    
+    material = {"pbrMetallicRoughness": {"metallicFactor": 0.0}, "doubleSided": True}
+    images = []
+    visual = mesh.visual
+    
+    if visual.kind == "texture" and getattr(visual, "uv", None) is not None:
+        uv = np.asarray(visual.uv, dtype=np.float32).copy()
+        uv[:, 1] = 1.0 - uv[:, 1]  # glTF UV origin is top-left
+        attributes["TEXCOORD_0"] = add_accessor(
+            add_view(uv, target=34962), 5126, count, "VEC2"
+        )
+        
+        mat = visual.material
+        image = getattr(mat, "baseColorTexture", None) or getattr(mat, "image", None)
+        if image is not None:
+            fmt = "JPEG" if image.format == "JPEG" else "PNG"
+            encoded = io.BytesIO()
+            image.save(encoded, format=fmt)
+            images.append({
+                "bufferView": add_view(np.frombuffer(encoded.getvalue(), dtype=np.uint8)),
+                "mimeType": f"image/{fmt.lower()}"
+            })
+            material["pbrMetallicRoughness"]["baseColorTexture"] = {"index": 0}
+    elif visual.kind == "vertex":
+        colors = np.ascontiguousarray(visual.vertex_colors, dtype=np.uint8)
+        attributes["COLOR_0"] = add_accessor(
+            add_view(colors, target=34962), 5121, count, "VEC4",
+            normalized=True
+        )
+    
+    index_type, index_dtype = (5123, np.uint16) if count < 65536 else (5125, np.uint32)
+    indices = add_accessor(
+        add_view(faces.astype(index_dtype).ravel(), target=34963),
+        index_type, faces.size, "SCALAR"
+    )
+    
+    tree = {
+        "asset": {"version": "2.0", "generator": "3D Model Viewer Pro"},
+        "extensionsUsed": ["KHR_mesh_quantization"],
+        "extensionsRequired": ["KHR_mesh_quantization"],
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{
+            "mesh": 0,
+            "translation": center.tolist(),
+            "scale": [half / 32767] * 3
+        }],
+        "meshes": [{"primitives": [{
+            "attributes": attributes,
+            "indices": indices,
+            "material": 0,
+            "mode": 4
+        }]}],
+        "materials": [material],
+        "accessors": accessors,
+        "bufferViews": buffer_views,
+        "buffers": [{"byteLength": offset}],
+    }
+    if images:
+        tree["images"] = images
+        tree["samplers"] = [{}]
+        tree["textures"] = [{"source": 0, "sampler": 0}]
+    
+    # GLB container: header, JSON chunk (space padded), BIN chunk
+    content = json.dumps(tree, separators=(",", ":")).encode()
+    content += b" " * (-len(content) % 4)
+    binary = b"".join(buffers)
+    length = 12 + 8 + len(content) + 8 + len(binary)
+    return b"".join([
+        struct.pack("<4sII", b"glTF", 2, length),
+        struct.pack("<I4s", len(content), b"JSON"), content,
+        struct.pack("<I4s", len(binary), b"BIN\x00"), binary,
+    ])
+
+
+# Progress queue of the conversion worker process (set by its initializer)
+_convert_progress = None
+
+
+def _init_convert_worker(progress_queue):
+    """Set up a converter process; importing trimesh here warms every worker"""
+    global _convert_progress
+    _convert_progress = progress_queue
+    import trimesh  # noqa: F401
+
+
+def _preload_converter():
+    """No-op task: makes the pool start a (self-warming) worker ahead of the first conversion"""
+
+
+def _convert_worker(input_path, output_path, quantize=False):
+    """
+    OBJ -> GLB conversion, run in the converter process.
+    Returns (GLB size, True if an up-to-date GLB was reused).
+    """
+    # Source marker kept next to the GLB: same input and options -> reuse it
+    input_st = os.stat(input_path)
+    marker = [input_st.st_size, input_st.st_mtime_ns, bool(quantize)]
+    marker_path = output_path + '.src'
+    output_st = safe_stat(output_path)
+    if output_st is not None and output_st.st_mtime_ns >= input_st.st_mtime_ns:
+        try:
+            with open(marker_path, 'rb') as f:
+                if load_json(f.read()) == marker:
+                    return output_st.st_size, True
+        except (OSError, ValueError):
+            pass
+    
+    import trimesh
+    
+    _convert_progress.put((0.2, "Loading OBJ file..."))
+    mesh = trimesh.load(input_path, process=False)
+    
+    _convert_progress.put((0.5, "Processing geometry..."))
+    
+    # Handle scene (a single geometry is used as-is, no copy)
+    if isinstance(mesh, trimesh.Scene):
+        geoms = list(mesh.geometry.values())
+        mesh = geoms[0] if len(geoms) == 1 else trimesh.util.concatenate(geoms)
+        # Release the source geometries before the GLB buffer is built
+        del geoms
+    
+    _convert_progress.put((0.8, "Saving GLB..."))
+    
+    # Export to GLB: build the buffer, drop the mesh, then write it out
+    if quantize:
+        glb = export_quantized_glb(mesh)
+    else:
+        glb = trimesh.exchange.gltf.export_glb(mesh)
+    del mesh
+    # Written aside and renamed: a crash or stop never leaves a truncated GLB
+    # behind, which the source marker would then report as up to date
+    part_path = partial_output_path(output_path)
+    with open(part_path, 'wb') as f:
+        f.write(glb)
+    os.replace(part_path, output_path)
+    
+    try:
+        with open(marker_path, 'wb') as f:
+            f.write(dump_json(marker))
+    except OSError:
+        pass
+    return len(glb), False
+
+
+# Last (epoch second, "HH:MM:SS") pair handed out by log_timestamp()
+_timestamp_cache = (None, "")
+
+
+def log_timestamp():
+    """Current time as HH:MM:SS, formatted at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _timestamp_cache[1]
+
+
+# Terminal text colors, each configured once as a text tag named after it
+TERMINAL_COLORS = (COLOR_DEFAULT, COLOR_OK, COLOR_SUCCESS, COLOR_INFO, COLOR_WARNING, COLOR_ERROR)
+
+# Queued log lines: drain interval and max lines moved per tick
+LOG_DRAIN_MS = 50
+LOG_BATCH = 500
+
+
+def take_batch(log_queue):
+    """Pop up to LOG_BATCH queued log entries without blocking"""
+    batch = []
+    try:
+        while len(batch) < LOG_BATCH:
+            batch.append(log_queue.get_nowait())
+    except queue.Empty:
+        pass
+    return batch
+
+
+class TerminalWindow(ctk.CTkToplevel):
+    """Base for the terminal windows: colored, capped, auto-scrolling log"""
+    
+    MAX_LINES = 5000
+    TRIM_SLACK = 500
+    
+    def __init__(self, parent, title):
         super().__init__(parent)
-        self.title("Interactive Terminal")
+        self._scroll_pending = False
+        self._lines = []  # Python copy of the widget text, one entry per line
+        self.title(title)
         self.geometry("900x600")
         
-        # Terminal output
-        self.terminal = ctk.CTkTextbox(
-            self, 
-            wrap="word", 
+        # Terminal output (subclasses pack terminal_frame)
+        self.terminal_frame, self.terminal = self._create_terminal()
+        
+        # Fixed tag palette: one tag per color, never one per line
+        for color in TERMINAL_COLORS:
+            self.terminal.tag_config(color, foreground=color)
+        
+        # Don't close on X, just hide
+        self.protocol("WM_DELETE_WINDOW", self.hide_window)
+        
+        # Lines posted from worker threads, written on the Tk thread
+        self._log_queue = queue.Queue()
+        self.after(LOG_DRAIN_MS, self._drain_queue)
+    
+    def _create_terminal(self):
+        """Build the output widget; returns (widget to pack, text widget)"""
+        textbox = ctk.CTkTextbox(
+            self,
+            wrap="word",
             font=("Consolas", 11),
             fg_color="#1a1a1a"
         )
-        self.terminal.pack(fill="both", expand=True, padx=10, pady=(10, 5))
+        return textbox, textbox
+    
+    def log(self, message, color="#E0E0E0", timestamp=None):
+        """Add message to terminal"""
+        if timestamp is None:
+            timestamp = log_timestamp()
+        self.write_batch([(message, color, timestamp)])
+    
+    def post(self, message, color="#E0E0E0"):
+        """Thread-safe log(): the line is written on the next queue drain"""
+        self._log_queue.put((message, color, log_timestamp()))
+    
+    def _drain_queue(self):
+        """Write lines posted by worker threads, a batch per tick"""
+        batch = take_batch(self._log_queue)
+        if batch:
+            self.write_batch(batch)
+        self.after(LOG_DRAIN_MS, self._drain_queue)
+    
+    def write_batch(self, entries):
+        """Insert (message, color, timestamp) entries, one insert per color run"""
+        for color, run in groupby(entries, key=itemgetter(1)):
+            # Colors outside the palette get their (single, shared) tag on first use
+            if color not in TERMINAL_COLORS:
+                self.terminal.tag_config(color, foreground=color)
+            text = "".join(f"[{timestamp}] {message}\n" for message, _, timestamp in run)
+            self.terminal.insert("end", text, color)
+            # One entry per widget line: a message (traceback...) may span several,
+            # and Tk only breaks lines on "\n"
+            self._lines.extend(line + "\n" for line in text[:-1].split("\n"))
+        
+        self._trim_scrollback()
+        self._schedule_scroll()
+    
+    def _trim_scrollback(self):
+        """Drop the oldest lines once the terminal exceeds MAX_LINES"""
+        # Lines are tracked in Python, no index() round-trip to Tcl
+        excess = len(self._lines) - self.MAX_LINES
+        if excess > 0:
+            # Trim TRIM_SLACK lines below the cap so a full terminal isn't
+            # re-laid out by a one-line delete on every insert
+            excess += self.TRIM_SLACK
+            self.terminal.delete("1.0", f"{excess + 1}.0")
+            del self._lines[:excess]
+    
+    def _schedule_scroll(self):
+        """Auto-scroll once per burst of log lines"""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._scroll_to_end)
+    
+    def _scroll_to_end(self):
+        self._scroll_pending = False
+        self.terminal.see("end")
+    
+    def clear(self):
+        """Clear terminal"""
+        self.terminal.delete("1.0", "end")
+        self._lines.clear()
+    
+    def copy_all(self):
+        """Copy all text to clipboard"""
+        # From the Python copy: no full-widget get() through Tcl
+        text = "".join(self._lines)
+        self.clipboard_clear()
+        self.clipboard_append(text)
+    
+    def hide_window(self):
+        """Hide instead of closing"""
+        self.withdraw()
+
+
+class InteractiveTerminal(TerminalWindow):
+    """Interactive terminal window with input capability"""
+    
+    COMMAND_TIMEOUT = 30
+    
+    def __init__(self, parent):
+        super().__init__(parent, "Interactive Terminal")
+        self.terminal_frame.pack(fill="both", expand=True, padx=10, pady=(10, 5))
         
         # Input frame
         input_frame = ctk.CTkFrame(self)
@@ -63,6 +540,15 @@ class InteractiveTerminal(ctk.CTkToplevel):
             width=100
         ).pack(side="right", padx=5)
         
+        self.running_label = ctk.CTkLabel(
+            input_frame,
+            text="",
+            font=("Consolas", 11),
+            text_color="#FFB74D",
+            width=80
+        )
+        self.running_label.pack(side="right", padx=5)
+        
         # Bottom buttons
         btn_frame = ctk.CTkFrame(self)
         btn_frame.pack(fill="x", padx=10, pady=(0, 10))
@@ -81,99 +567,118 @@ class InteractiveTerminal(ctk.CTkToplevel):
             width=100
         ).pack(side="left", padx=5)
         
-        # Process tracking
+        # Process tracking: commands run one at a time on a single worker
         self.current_process = None
-        
-        # Don't close on X, just hide
-        self.protocol("WM_DELETE_WINDOW", self.hide_window)
+        self._commands = queue.Queue()
+        self._worker = None
+        self._busy = False
+        self._busy_shown = False
         
         self.log("Terminal ready. Type commands or run scripts.", "#4CAF50")
     
-    def log(self, message, color="#E0E0E0"):
-        """Add message to terminal"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.terminal.insert("end", f"[{timestamp}] {message}\n")
-        
-        # Get the line that was just inserted
-        line_start = self.terminal.index("end-2l linestart")
-        line_end = self.terminal.index("end-2l lineend")
-        
-        # Create unique tag for this line
-        tag = f"line_{timestamp}_{len(message)}"
-        self.terminal.tag_add(tag, line_start, line_end)
-        self.terminal.tag_config(tag, foreground=color)
-        
-        # Auto-scroll
-        self.terminal.see("end")
-    
     def execute_command(self, event):
-        """Execute command from input"""
+        """Queue the command from input and return to Tk right away"""
         command = self.input_entry.get().strip()
         if not command:
             return
         
-        self.log(f"$ {command}", "#4CAF50")
         self.input_entry.delete(0, "end")
+        self._commands.put(command)
+        
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._command_worker, daemon=True)
+            self._worker.start()
+    
+    def _command_worker(self):
+        """Run queued commands in submission order"""
+        while True:
+            command = self._commands.get()
+            self._busy = True
+            self.post(f"$ {command}", "#4CAF50")
+            self._run_command(command)
+            self._busy = not self._commands.empty()
+    
+    def _drain_queue(self):
+        super()._drain_queue()
         
+        # Reflect the worker state (set off the Tk thread) in the input row
+        if self._busy != self._busy_shown:
+            self._busy_shown = self._busy
+            self.running_label.configure(text="running…" if self._busy else "")
+    
+    def _run_command(self, command):
+        """Run a command, streaming its output into the terminal as it arrives"""
         try:
-            # Execute command
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
+            # Skip the extra shell process when the command doesn't need one
+            args = direct_command_args(command)
+            process = subprocess.Popen(
+                args if args is not None else command,
+                shell=args is None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=30
+                errors="replace",
+                bufsize=1
             )
+            self.current_process = process
             
-            # Show output
-            if result.stdout:
-                self.log(result.stdout.strip(), "#E0E0E0")
-            if result.stderr:
-                self.log(result.stderr.strip(), "#EF5350")
+            # Kill the command at the time limit, even if it stops printing
+            timed_out = threading.Event()
             
-            if result.returncode == 0:
-                self.log(f"✓ Command completed (exit code: 0)", "#81C784")
+            def kill():
+                timed_out.set()
+                process.kill()
+            
+            timer = threading.Timer(self.COMMAND_TIMEOUT, kill)
+            timer.start()
+            try:
+                # stderr is pumped on a helper thread so it shows up in red
+                stderr_reader = threading.Thread(
+                    target=self._pump_output,
+                    args=(process.stderr, "#EF5350"),
+                    daemon=True
+                )
+                stderr_reader.start()
+                self._pump_output(process.stdout, "#E0E0E0")
+                stderr_reader.join()
+                returncode = process.wait()
+            finally:
+                timer.cancel()
+                self.current_process = None
+            
+            if timed_out.is_set():
+                self.post(f"✗ Command timeout ({self.COMMAND_TIMEOUT}s limit)", "#FF9800")
+            elif returncode == 0:
+                self.post(f"✓ Command completed (exit code: 0)", "#81C784")
             else:
-                self.log(f"✗ Command failed (exit code: {result.returncode})", "#EF5350")
+                self.post(f"✗ Command failed (exit code: {returncode})", "#EF5350")
                 
-        except subprocess.TimeoutExpired:
-            self.log("✗ Command timeout (30s limit)", "#FF9800")
         except Exception as e:
-            self.log(f"✗ Error: {str(e)}", "#EF5350")
+            self.post(f"✗ Error: {str(e)}", "#EF5350")
+    
+    def _pump_output(self, stream, color):
+        """Post each non-blank line of a command output stream"""
+        for line in stream:
+            if line.strip():
+                self.post(line.rstrip(), color)
     
     def clear(self):
         """Clear terminal"""
-        self.terminal.delete("1.0", "end")
+        super().clear()
         self.log("Terminal cleared.", "#4CAF50")
     
     def copy_all(self):
         """Copy all text to clipboard"""
-        text = self.terminal.get("1.0", "end")
-        self.clipboard_clear()
-        self.clipboard_append(text)
+        super().copy_all()
         self.log("✓ Copied to clipboard", "#4CAF50")
-    
-    def hide_window(self):
-        """Hide instead of closing"""
-        self.withdraw()
 
 
-class ViewerTerminal(ctk.CTkToplevel):
+class ViewerTerminal(TerminalWindow):
     """Real-time viewer process terminal"""
     
     def __init__(self, parent):
-        super().__init__(parent)
-        self.title("Viewer Terminal Output")
-        self.geometry("900x600")
-        
-        # Terminal output
-        self.terminal = ctk.CTkTextbox(
-            self,
-            wrap="word",
-            font=("Consolas", 11),
-            fg_color="#1a1a1a"
-        )
-        self.terminal.pack(fill="both", expand=True, padx=10, pady=10)
+        super().__init__(parent, "Viewer Terminal Output")
+        self.terminal_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Bottom buttons
         btn_frame = ctk.CTkFrame(self)
@@ -194,39 +699,121 @@ class ViewerTerminal(ctk.CTkToplevel):
         ).pack(side="right", padx=5)
         
         self.process = None
-        self.protocol("WM_DELETE_WINDOW", self.hide_window)
-        
-    def log(self, message, color="#E0E0E0"):
-        """Add message to terminal"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.terminal.insert("end", f"[{timestamp}] {message}\n")
+    
+    def _create_terminal(self):
+        """Plain tk.Text for the high-rate viewer log (no CTkTextbox overhead)"""
+        frame = ctk.CTkFrame(self, fg_color="#1a1a1a")
         
-        line_start = self.terminal.index("end-2l linestart")
-        line_end = self.terminal.index("end-2l lineend")
-        tag = f"line_{timestamp}"
-        self.terminal.tag_add(tag, line_start, line_end)
-        self.terminal.tag_config(tag, foreground=color)
+        text = tk.Text(
+            frame,
+            wrap="word",
+            font=("Consolas", 11),
+            bg="#1a1a1a",
+            fg="#E0E0E0",
+            insertbackground="#E0E0E0",
+            borderwidth=0,
+            highlightthickness=0,
+            padx=5,
+            pady=5
+        )
+        scrollbar = ctk.CTkScrollbar(frame, command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
         
-        self.terminal.see("end")
-    
-    def clear(self):
-        """Clear terminal"""
-        self.terminal.delete("1.0", "end")
+        scrollbar.pack(side="right", fill="y")
+        text.pack(side="left", fill="both", expand=True)
+        return frame, text
+
+
+class RecentFileRow:
+    """One entry of the recent files list, reused across refreshes"""
     
-    def copy_all(self):
-        """Copy all text to clipboard"""
-        text = self.terminal.get("1.0", "end")
-        self.clipboard_clear()
-        self.clipboard_append(text)
+    def __init__(self, parent, on_load):
+        self.filepath = None
+        self._texts = None
+        
+        self.frame = ctk.CTkFrame(parent)
+        
+        # Info frame
+        info_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
+        info_frame.pack(side="left", fill="x", expand=True)
+        
+        # Filename
+        self.name_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=ctk.CTkFont(size=13),
+            anchor="w"
+        )
+        self.name_label.pack(side="top", anchor="w", padx=10, pady=(8, 2))
+        
+        # Path and size
+        self.info_label = ctk.CTkLabel(
+            info_frame,
+            text="",
+            font=ctk.CTkFont(size=10),
+            text_color="#B0BEC5",
+            anchor="w"
+        )
+        self.info_label.pack(side="top", anchor="w", padx=10, pady=(0, 8))
+        
+        # Load button
+        ctk.CTkButton(
+            self.frame,
+            text="Load",
+            command=lambda: on_load(self.filepath),
+            width=90,
+            height=35
+        ).pack(side="right", padx=8, pady=5)
     
-    def hide_window(self):
-        """Hide instead of closing"""
-        self.withdraw()
+    def set_file(self, filepath, filename, path_text):
+        """Point the row at a file (labels are only touched if the text changed)"""
+        self.filepath = filepath
+        if self._texts != (filename, path_text):
+            self._texts = (filename, path_text)
+            self.name_label.configure(text=filename)
+            self.info_label.configure(text=path_text)
 
 
 class ViewerGUI(ctk.CTk):
     """Main application window"""
     
+    # File dialog filters
+    _FT_MODEL = (
+        ("3D Models", "*.glb *.obj *.gltf"),
+        ("GLB files (fastest)", "*.glb"),
+        ("OBJ files", "*.obj"),
+        ("GLTF files", "*.gltf"),
+        ("All files", "*.*")
+    )
+    _FT_TEXTURE = (
+        ("Images", "*.png *.jpg *.jpeg *.webp *.bmp *.tga"),
+        ("PNG files", "*.png"),
+        ("JPEG files", "*.jpg *.jpeg"),
+        ("All files", "*.*")
+    )
+    _FT_OBJ = (("OBJ files", "*.obj"), ("All files", "*.*"))
+    _FT_GLB = (("GLB files", "*.glb"), ("All files", "*.*"))
+    
+    # Config writes wait for this much quiet time after the last change
+    SAVE_DELAY_MS = 500
+    
+    # Recent files kept (and rows ever built): small enough to keep every row live
+    MAX_RECENT = 10
+    
+    # Seconds a recent file's stat result is trusted before checking again
+    STAT_TTL = 2.0
+    MISSING_TTL = 5.0
+    
+    # Minimum time between layout passes while the window is being resized
+    LAYOUT_THROTTLE_MS = 50
+    
+    # How long a result banner stays up (errors stay twice as long)
+    BANNER_MS = 4000
+    
+    # Parallel conversions for batches: about half the cores, capped because
+    # every worker holds a whole (often very large) scan in memory
+    CONVERT_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+    
     def __init__(self):
         super().__init__()
         
@@ -240,30 +827,67 @@ class ViewerGUI(ctk.CTk):
         # Variables
         self.model_path = ctk.StringVar()
         self.texture_path = ctk.StringVar()
+        self.input_path = ctk.StringVar()
         self.output_path = ctk.StringVar()
         self.rotation_offset = ctk.DoubleVar(value=0.0)
+        self.prewarm_viewer = ctk.BooleanVar(value=False)  # Opt-in, saved in the config
+        self.quantize_output = ctk.BooleanVar(value=False)
         
         # Config
         self.config_file = Path.home() / ".3d_viewer_config.json"
         self.recent_files = []
+        self._stat_cache = {}  # filepath -> (expiry, stat_result or None if missing)
+        self._config_loaded = False
         
-        # Terminals
-        self.interactive_terminal = InteractiveTerminal(self)
-        self.interactive_terminal.withdraw()
+        # Debounced config writes: pending job, write order, writer lock
+        self._save_job = None
+        self._save_seq = 0
+        self._saved_seq = 0
+        self._saved_config = None  # (recent files, pre-warm) as last written to disk
+        self._save_lock = threading.Lock()
         
-        self.viewer_terminal = ViewerTerminal(self)
-        self.viewer_terminal.withdraw()
+        # Terminals (the interactive one is built the first time it is opened)
+        self.interactive_terminal = None
         
-        # Current viewer process
+        # Viewer terminal is built on first use. Log lines (from any thread)
+        # are queued and drained on the Tk thread in batches
+        self.viewer_terminal = None
+        self._log_queue = queue.Queue()
+        
+        # Current viewer process, plus an idle pre-warmed one for the next launch
         self.viewer_process = None
+        self._warm_viewer = None
+        self._viewer_cmd_cache = None
         
-        # Load config
-        self.load_config()
+        # Pending debounced resize, and the last recent-files height applied
+        self._resize_job = None
+        self._recent_height = None
+        
+        # OBJ -> GLB converter processes (started on first use) and the
+        # conversions in flight: (future, input, output, input stat)
+        self._convert_pool = None
+        self._convert_progress = None
+        self._convert_jobs = []
+        self._convert_total = 0
+        self._convert_failed = 0
+        
+        # Pending auto-hide of the result banner
+        self._banner_job = None
+        
+        # Files picked for a batch conversion, and the summary shown for them
+        self._batch_inputs = None
+        self._batch_label = None
         
         # Create UI
         self.create_ui()
         
-        self.viewer_terminal.log("Application started", "#4CAF50")
+        # Load config (in background, recent files fill in when ready)
+        self.load_config()
+        
+        self.log("Application started", "#4CAF50")
+        
+        # Start moving queued log lines into the viewer terminal
+        self._drain_log_queue()
     
     def create_ui(self):
         """Create main interface"""
@@ -287,6 +911,16 @@ class ViewerGUI(ctk.CTk):
         )
         subtitle.pack()
         
+        # Non-modal result banner (packed only while a message is shown)
+        self.banner = ctk.CTkLabel(
+            header,
+            text="",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            text_color="#FFFFFF",
+            corner_radius=6,
+            height=32
+        )
+        
         # === MAIN CONTENT ===
         content = ctk.CTkFrame(self)
         content.pack(fill="both", expand=True, padx=20, pady=(0, 20))
@@ -307,7 +941,7 @@ class ViewerGUI(ctk.CTk):
         self.create_settings_tab(tab_settings)
         self.create_credits_tab(tab_credits)
         # Update layout on window resize
-        self.bind("<Configure>", lambda e: self.after(100, self.update_layout_sizes))
+        self.bind("<Configure>", self._on_configure)
         
         # === FOOTER ===
         footer = ctk.CTkFrame(self, height=50, corner_radius=0)
@@ -460,6 +1094,15 @@ class ViewerGUI(ctk.CTk):
         self.recent_scroll = ctk.CTkScrollableFrame(recent_frame, height=200)
         self.recent_scroll.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
+        self.no_recent_label = ctk.CTkLabel(
+            self.recent_scroll,
+            text="No recent files",
+            text_color="#757575",
+            font=ctk.CTkFont(size=12)
+        )
+        self._recent_rows = []
+        self._spare_rows = []
+        
         self.update_recent_files()
     
     def create_converter_tab(self, parent):
@@ -497,6 +1140,7 @@ class ViewerGUI(ctk.CTk):
         
         self.conv_input = ctk.CTkEntry(
             input_entry_frame,
+            textvariable=self.input_path,
             placeholder_text="Select OBJ file to convert...",
             height=40
         )
@@ -539,6 +1183,14 @@ class ViewerGUI(ctk.CTk):
             height=40
         ).pack(side="right", padx=(0, 5))
         
+        # Options
+        ctk.CTkCheckBox(
+            parent,
+            text="Quantize output (int16 positions, int8 normals - smaller GLB)",
+            variable=self.quantize_output,
+            font=ctk.CTkFont(size=12)
+        ).pack(anchor="w", padx=30, pady=(5, 0))
+        
         # Progress
         self.progress_label = ctk.CTkLabel(
             parent,
@@ -612,6 +1264,13 @@ class ViewerGUI(ctk.CTk):
         self.viewer_path_entry.pack(side="left", fill="x", expand=True, padx=(5, 5))
         self.viewer_path_entry.insert(0, "viewer-glb.py")
         
+        ctk.CTkCheckBox(
+            viewer_frame,
+            text="Pre-load viewer in background (faster launch, uses more memory)",
+            variable=self.prewarm_viewer,
+            command=self.toggle_prewarm
+        ).pack(anchor="w", padx=10, pady=(0, 10))
+        
         # About
         about_frame = ctk.CTkFrame(parent)
         about_frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -786,62 +1445,60 @@ Easy to use, powerful features
         """Browse for model file"""
         filename = filedialog.askopenfilename(
             title="Select 3D Model",
-            filetypes=[
-                ("3D Models", "*.glb *.obj *.gltf"),
-                ("GLB files (fastest)", "*.glb"),
-                ("OBJ files", "*.obj"),
-                ("GLTF files", "*.gltf"),
-                ("All files", "*.*")
-            ]
+            filetypes=self._FT_MODEL
         )
         if filename:
             self.model_path.set(filename)
-            self.viewer_terminal.log(f"Model selected: {Path(filename).name}", "#4CAF50")
+            self.log(f"Model selected: {os.path.basename(filename)}", "#4CAF50")
     
     def browse_texture(self):
         """Browse for texture file"""
         filename = filedialog.askopenfilename(
             title="Select Texture",
-            filetypes=[
-                ("Images", "*.png *.jpg *.jpeg *.webp *.bmp *.tga"),
-("PNG files", "*.png"),
-                ("JPEG files", "*.jpg *.jpeg"),
-                ("All files", "*.*")
-            ]
+            filetypes=self._FT_TEXTURE
         )
         if filename:
             self.texture_path.set(filename)
-            self.viewer_terminal.log(f"Texture selected: {Path(filename).name}", "#4CAF50")
+            self.log(f"Texture selected: {os.path.basename(filename)}", "#4CAF50")
     
     def browse_convert_input(self):
-        """Browse for OBJ to convert"""
-        filename = filedialog.askopenfilename(
-            title="Select OBJ File",
-            filetypes=[("OBJ files", "*.obj"), ("All files", "*.*")]
+        """Browse for OBJ(s) to convert (several files convert as a batch)"""
+        filenames = filedialog.askopenfilenames(
+            title="Select OBJ File(s)",
+            filetypes=self._FT_OBJ
         )
-        if filename:
-            self.conv_input.delete(0, "end")
-            self.conv_input.insert(0, filename)
+        if len(filenames) > 1:
+            # Batch: the entry shows a summary, each GLB goes next to its OBJ
+            self._batch_inputs = list(filenames)
+            names = ", ".join(os.path.basename(f) for f in filenames)
+            self._batch_label = f"{len(filenames)} files: {names}"
+            self.input_path.set(self._batch_label)
+            self.output_path.set("(next to each OBJ)")
+            self.log(f"Input OBJs: {len(filenames)} files", "#90CAF9")
+            self._preload_converter_pool()
+        elif filenames:
+            filename = filenames[0]
+            self._batch_inputs = None
+            self.input_path.set(filename)
             
-            # Auto-fill output
-            output = str(Path(filename).with_suffix('.glb'))
-            self.output_path.set(output)
-            self.conv_output.delete(0, "end")
-            self.conv_output.insert(0, output)
+            # Auto-fill output (conv_output is bound to output_path)
+            self.output_path.set(os.path.splitext(filename)[0] + '.glb')
             
-            self.viewer_terminal.log(f"Input OBJ: {Path(filename).name}", "#90CAF9")
+            self.log(f"Input OBJ: {os.path.basename(filename)}", "#90CAF9")
+            
+            # A conversion is likely next: start the converter process and
+            # import trimesh there while the user checks the output path
+            self._preload_converter_pool()
     
     def browse_convert_output(self):
         """Browse for output GLB"""
         filename = filedialog.asksaveasfilename(
             title="Save GLB As",
             defaultextension=".glb",
-            filetypes=[("GLB files", "*.glb"), ("All files", "*.*")]
+            filetypes=self._FT_GLB
         )
         if filename:
             self.output_path.set(filename)
-            self.conv_output.delete(0, "end")
-            self.conv_output.insert(0, filename)
     
     def launch_viewer(self):
         """Launch the 3D viewer with real-time output"""
@@ -851,63 +1508,72 @@ Easy to use, powerful features
             messagebox.showerror("Error", "Please select a 3D model file!")
             return
         
-        if not Path(model).exists():
+        if safe_stat(model) is None:
             messagebox.showerror("Error", f"File not found:\n{model}")
             return
         
-        viewer_script = self.viewer_path_entry.get()
-        
-        # Check if script exists in current directory or is bundled
-        if not Path(viewer_script).exists():
-            # Try to find it in the same directory as the exe/script
-            script_dir = Path(sys.executable).parent if getattr(sys, 'frozen', False) else Path(__file__).parent
-            alternative_path = script_dir / viewer_script
-            
-            if alternative_path.exists():
-                viewer_script = str(alternative_path)
-            else:
-                messagebox.showerror(
-                    "Error", 
-                    f"Viewer script not found:\n{viewer_script}\n\n"
-                    f"Also tried: {alternative_path}\n\n"
-                    "Please check the path in Settings tab."
-                )
-                return
+        viewer_cmd = self._viewer_command()
+        if viewer_cmd is None:
+            return
         
-        # Build command with rotation parameter
-        cmd = [sys.executable, viewer_script, model]
+        # Viewer arguments (model, optional texture, rotation parameter)
+        args = [model]
         
         texture = self.texture_path.get()
-        if texture and Path(texture).exists():
-            cmd.append(texture)
+        if texture and safe_stat(texture) is not None:
+            args.append(texture)
         
         # Add rotation offset if not zero
         rotation = self.rotation_offset.get()
         if rotation != 0:
-            cmd.extend(["--rotation-offset", str(rotation)])
+            args.extend(["--rotation-offset", str(rotation)])
+        
+        cmd = viewer_cmd + args
         
         try:
-            self.viewer_terminal.log(f"═══════════════════════════════════════", "#4CAF50")
-            self.viewer_terminal.log(f"Launching viewer: {Path(model).name}", "#4CAF50")
-            self.viewer_terminal.log(f"Command: {' '.join(cmd)}", "#90CAF9")
-            self.viewer_terminal.log(f"═══════════════════════════════════════", "#4CAF50")
+            self.log(f"═══════════════════════════════════════", "#4CAF50")
+            self.log(f"Launching viewer: {os.path.basename(model)}", "#4CAF50")
+            self.log(f"Command: {' '.join(cmd)}", "#90CAF9")
+            self.log(f"═══════════════════════════════════════", "#4CAF50")
             
             # Show viewer terminal
-            self.viewer_terminal.deiconify()
+            self.show_viewer_terminal()
             
-            # Launch process and capture output
-            self.viewer_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
+            warm = self._warm_viewer
+            self._warm_viewer = None
+            process = None
+            if warm is not None and warm.poll() is None and warm.args[:-1] == viewer_cmd:
+                # Hand the model to the pre-warmed viewer (imports already done)
+                try:
+                    warm.stdin.write((json.dumps(args) + "\n").encode())
+                    warm.stdin.close()
+                    process = warm
+                except OSError:
+                    # It died since poll(): start a fresh viewer instead
+                    self.log("Pre-loaded viewer exited, starting a new one", COLOR_WARNING)
+            
+            if process is not None:
+                self.viewer_process = process
+            else:
+                if warm is not None and warm.poll() is None:
+                    warm.kill()
+                
+                # Launch process and capture output
+                self.viewer_process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=0,
+                    **VIEWER_POPEN_FLAGS
+                )
+            
+            # Get the next viewer warmed up in the background
+            self._spawn_warm_viewer(viewer_cmd)
             
             # Start output monitoring thread
             threading.Thread(
                 target=self._monitor_viewer_output,
+                args=(self.viewer_process,),
                 daemon=True
             ).start()
             
@@ -917,127 +1583,408 @@ Easy to use, powerful features
             self.status_label.configure(text="✓ Viewer launched", text_color="#81C784")
             
         except Exception as e:
-            self.viewer_terminal.log(f"Failed to launch: {str(e)}", "#EF5350")
+            self.log(f"Failed to launch: {str(e)}", "#EF5350")
             messagebox.showerror("Error", f"Failed to launch viewer:\n{str(e)}")
     
-    def _monitor_viewer_output(self):
-        """Monitor viewer process output in real-time"""
-        if not self.viewer_process:
+    def _viewer_command(self, show_errors=True):
+        """Command prefix that starts the viewer (engine exe or python + script)"""
+        # Resolved once per Settings path, not re-checked on every launch
+        viewer_script = self.viewer_path_entry.get()
+        if self._viewer_cmd_cache is not None and self._viewer_cmd_cache[0] == viewer_script:
+            return list(self._viewer_cmd_cache[1])
+        
+        viewer_cmd = self._resolve_viewer_command(viewer_script, show_errors)
+        if viewer_cmd is not None:
+            self._viewer_cmd_cache = (viewer_script, viewer_cmd)
+            return list(viewer_cmd)
+        return None
+    
+    def _resolve_viewer_command(self, viewer_script, show_errors):
+        """Locate the viewer engine or script on disk"""
+        engine = self._find_viewer_engine()
+        if engine:
+            # Frozen build: run the standalone viewer engine directly
+            return [engine]
+        if getattr(sys, 'frozen', False):
+            # A frozen GUI can't run the .py viewer itself: the engine is required
+            if show_errors:
+                messagebox.showerror(
+                    "Error",
+                    "3D_Viewer_Engine was not found next to the application.\n\n"
+                    "Please reinstall or keep the whole 'dist' folder together."
+                )
+            return None
+        
+        # Check if script exists in current directory
+        script_st = safe_stat(viewer_script)
+        if script_st is None:
+            # Try to find it in the same directory as this script
+            alternative_path = Path(__file__).parent / viewer_script
+            script_st = safe_stat(alternative_path)
+            
+            if script_st is not None:
+                viewer_script = str(alternative_path)
+            else:
+                if show_errors:
+                    messagebox.showerror(
+                        "Error", 
+                        f"Viewer script not found:\n{viewer_script}\n\n"
+                        f"Also tried: {alternative_path}\n\n"
+                        "Please check the path in Settings tab."
+                    )
+                return None
+        
+        return [sys.executable, viewer_script]
+    
+    def _spawn_warm_viewer(self, viewer_cmd=None):
+        """Start a viewer that imports its libraries now and waits for a model"""
+        if not self.prewarm_viewer.get() or self._warm_viewer is not None:
             return
         
+        if viewer_cmd is None:
+            viewer_cmd = self._viewer_command(show_errors=False)
+            if viewer_cmd is None:
+                return
+        
+        try:
+            self._warm_viewer = subprocess.Popen(
+                viewer_cmd + ["--warm"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+                **VIEWER_POPEN_FLAGS
+            )
+        except Exception as e:
+            self.log(f"Viewer pre-loading unavailable: {str(e)}", "#FF9800")
+    
+    def _stop_warm_viewer(self):
+        """Kill the idle pre-warmed viewer, if any"""
+        if self._warm_viewer is not None:
+            if self._warm_viewer.poll() is None:
+                self._warm_viewer.kill()
+            self._warm_viewer = None
+    
+    def toggle_prewarm(self):
+        """Enable/disable background pre-loading of the viewer"""
+        if self.prewarm_viewer.get():
+            self._spawn_warm_viewer()
+        else:
+            self._stop_warm_viewer()
+        self.save_config()
+    
+    def _find_viewer_engine(self):
+        """Locate the 3D_Viewer_Engine executable shipped next to a frozen GUI"""
+        if not getattr(sys, 'frozen', False):
+            return None
+        
+        name = "3D_Viewer_Engine.exe" if os.name == 'nt' else "3D_Viewer_Engine"
+        # --onefile: same folder; --onedir: sibling folder (also from inside a .app)
+        for base in list(Path(sys.executable).parents)[:4]:
+            for candidate in (base / name, base / "3D_Viewer_Engine" / name):
+                if candidate.is_file():
+                    return str(candidate)
+        return None
+    
+    def _monitor_viewer_output(self, process):
+        """Monitor viewer process output in real-time"""
+        # Read whatever is available (up to VIEWER_READ_SIZE per syscall) and
+        # split lines here, rather than a readline() and a text decode per line
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        
         try:
-            for line in iter(self.viewer_process.stdout.readline, ''):
-                if line:
-                    line = line.rstrip()
-                    
-                    # Color code based on content
-                    color = "#E0E0E0"
-                    if "error" in line.lower() or "failed" in line.lower():
-                        color = "#EF5350"
-                    elif "warning" in line.lower():
-                        color = "#FF9800"
-                    elif "success" in line.lower() or "loaded" in line.lower():
-                        color = "#81C784"
-                    
-                    self.viewer_terminal.log(line, color)
+            while True:
+                chunk = process.stdout.read(VIEWER_READ_SIZE)
+                if not chunk:
+                    break
+                pending += decoder.decode(chunk)
+                *lines, pending = pending.split("\n")
+                for line in lines:
+                    self._log_viewer_line(line.rstrip())
+            
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                self._log_viewer_line(pending.rstrip())
             
             # Process finished
-            returncode = self.viewer_process.wait()
-            self.viewer_terminal.log(f"═══════════════════════════════════════", "#90CAF9")
-            self.viewer_terminal.log(f"Viewer process finished (exit code: {returncode})", "#90CAF9")
-            self.viewer_terminal.log(f"═══════════════════════════════════════", "#90CAF9")
+            returncode = process.wait()
+            self.log(f"═══════════════════════════════════════", "#90CAF9")
+            self.log(f"Viewer process finished (exit code: {returncode})", "#90CAF9")
+            self.log(f"═══════════════════════════════════════", "#90CAF9")
             
         except Exception as e:
-            self.viewer_terminal.log(f"Error monitoring output: {str(e)}", "#EF5350")
+            self.log(f"Error monitoring output: {str(e)}", "#EF5350")
+    
+    def _log_viewer_line(self, line):
+        """Log one line of viewer output, colored by its content"""
+        match = VIEWER_LINE_CLASSES.match(line)
+        color = VIEWER_LINE_COLORS[match.lastindex] if match else COLOR_DEFAULT
+        self.log(line, color)
     
     def convert_obj_to_glb(self):
-        """Convert OBJ to GLB in separate thread"""
-        input_path = self.conv_input.get()
-        output_path = self.conv_output.get()
+        """Convert OBJ to GLB in the converter process(es)"""
+        if self._convert_jobs:
+            messagebox.showinfo("Busy", "A conversion is already running.")
+            return
+        
+        input_path = self.input_path.get()
         
-        if not input_path:
-            messagebox.showerror("Error", "Please select an input OBJ file!")
+        if self._batch_inputs is not None and input_path == self._batch_label:
+            jobs = []
+            for path in self._batch_inputs:
+                input_st = safe_stat(path)
+                if input_st is None:
+                    messagebox.showerror("Error", f"Input file not found:\n{path}")
+                    return
+                jobs.append((path, os.path.splitext(path)[0] + '.glb', input_st))
+        else:
+            output_path = self.output_path.get()
+            
+            if not input_path:
+                messagebox.showerror("Error", "Please select an input OBJ file!")
+                return
+            
+            input_st = safe_stat(input_path)
+            if input_st is None:
+                messagebox.showerror("Error", f"Input file not found:\n{input_path}")
+                return
+            
+            if not output_path:
+                messagebox.showerror("Error", "Please specify output GLB path!")
+                return
+            
+            jobs = [(input_path, output_path, input_st)]
+        
+        # Convert in separate processes: the GUI stays responsive and is
+        # insulated from trimesh crashes. Progress comes back over a queue.
+        quantize = self.quantize_output.get()
+        for attempt in range(2):
+            converter = self._converter()
+            try:
+                futures = [converter.submit(_convert_worker, path, output, quantize)
+                           for path, output, _ in jobs]
+                break
+            except BrokenProcessPool as e:
+                # A worker died since the last run: retry once on a fresh pool
+                self._drop_convert_pool()
+                error = e
+        else:
+            self.log(f"Could not start the converter: {str(error)}", "#EF5350")
+            self.show_banner(f"✗ Could not start the converter: {str(error)}", "err")
             return
         
-        if not Path(input_path).exists():
-            messagebox.showerror("Error", f"Input file not found:\n{input_path}")
+        self._convert_progress = converter.progress
+        try:
+            while True:
+                self._convert_progress.get_nowait()  # Drop stale progress
+        except queue.Empty:
+            pass
+        
+        self._convert_jobs = []
+        for future, (path, output, input_st) in zip(futures, jobs):
+            self.log(f"Converting: {os.path.basename(path)}", "#90CAF9")
+            self._convert_jobs.append((future, path, output, input_st))
+        self._convert_total = len(jobs)
+        self._convert_failed = 0
+        
+        self.progress_label.configure(text="Starting converter...")
+        self.progress_bar.set(0.1 if len(jobs) == 1 else 0)
+        self.after(100, self._poll_conversion)
+    
+    def _converter(self):
+        """Converter process pool, started on first use and kept for later runs"""
+        if self._convert_pool is not None and self._convert_pool.broken:
+            self._drop_convert_pool()
+        if self._convert_pool is None:
+            # Spawn, not fork: forking the multi-threaded Tk process is unsafe
+            context = multiprocessing.get_context('spawn')
+            progress = context.Queue()
+            self._convert_pool = ProcessPoolExecutor(
+                max_workers=self.CONVERT_WORKERS,
+                mp_context=context,
+                initializer=_init_convert_worker,
+                initargs=(progress,)
+            )
+            self._convert_pool.progress = progress
+            self._convert_pool.broken = False
+        return self._convert_pool
+    
+    def _drop_convert_pool(self):
+        """Release a broken converter pool; the next _converter() starts a fresh one"""
+        if self._convert_pool is not None:
+            self._convert_pool.shutdown(wait=False, cancel_futures=True)
+            self._convert_pool = None
+    
+    def _stop_converter(self):
+        """Stop the converter pool, killing the workers of a running conversion"""
+        if self._convert_pool is None:
             return
+        # shutdown() lets running tasks finish: terminate their processes too
+        processes = list((self._convert_pool._processes or {}).values())
+        self._convert_pool.shutdown(wait=False, cancel_futures=True)
+        self._convert_pool = None
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=2)  # Windows: the output file must be closed first
+        for _, _, output_path, _ in self._convert_jobs:
+            remove_partial_output(output_path)
+        self._convert_jobs = []
+    
+    def _preload_converter_pool(self):
+        """Start the converter pool ahead of a likely conversion"""
+        if self._convert_pool is not None:
+            return
+        pool = self._converter()
+        try:
+            future = pool.submit(_preload_converter)
+        except BrokenProcessPool:
+            self._drop_convert_pool()
+            return
+        
+        def mark_broken(future):
+            # Runs on the pool's thread: only flag the pool, _converter() replaces it
+            if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+                pool.broken = True
+        future.add_done_callback(mark_broken)
+    
+    def _poll_conversion(self):
+        """Show conversion progress and the results as workers finish"""
+        batch = self._convert_total > 1
+        
+        # Per-stage updates only mean something for a single file
+        try:
+            while True:
+                fraction, text = self._convert_progress.get_nowait()
+                if not batch:
+                    self.progress_bar.set(fraction)
+                    self.progress_label.configure(text=text)
+        except queue.Empty:
+            pass
+        
+        pending = []
+        for job in self._convert_jobs:
+            if job[0].done():
+                self._finish_conversion(*job, batch=batch)
+            else:
+                pending.append(job)
+        self._convert_jobs = pending
+        
+        if batch:
+            done = self._convert_total - len(pending)
+            self.progress_bar.set(done / self._convert_total)
+            self.progress_label.configure(text=f"Converted {done}/{self._convert_total}...")
         
-        if not output_path:
-            messagebox.showerror("Error", "Please specify output GLB path!")
+        if pending:
+            self.after(100, self._poll_conversion)
             return
         
-        # Run in thread to not freeze GUI
-        thread = threading.Thread(target=self._do_conversion, args=(input_path, output_path))
-        thread.daemon = True
-        thread.start()
+        if batch:
+            succeeded = self._convert_total - self._convert_failed
+            message = f"Converted {succeeded} of {self._convert_total} files"
+            if self._convert_failed:
+                self.progress_label.configure(text=f"✗ {message}")
+                self.show_banner(f"✗ {message} - see Viewer Output for details", "err")
+            else:
+                self.progress_label.configure(text=f"✓ {message}")
+                self.show_banner(f"✓ {message}")
     
-    def _do_conversion(self, input_path, output_path):
-        """Actual conversion (runs in thread)"""
+    def _finish_conversion(self, future, input_path, output_path, input_st, batch=False):
+        """Report one finished conversion"""
         try:
-            self.viewer_terminal.log(f"Converting: {Path(input_path).name}", "#90CAF9")
-            self.progress_label.configure(text="Loading OBJ file...")
-            self.progress_bar.set(0.2)
-            
-            # Load OBJ
-            mesh = trimesh.load(input_path, process=False)
-            
-            self.progress_label.configure(text="Processing geometry...")
-            self.progress_bar.set(0.5)
-            
-            # Handle scene
-            if isinstance(mesh, trimesh.Scene):
-                mesh = trimesh.util.concatenate(list(mesh.geometry.values()))
-            
-            self.progress_label.configure(text="Saving GLB...")
-            self.progress_bar.set(0.8)
-            
-            # Export to GLB
-            mesh.export(output_path, file_type='glb')
-            
+            glb_size, reused = future.result()
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                # Worker died: release the broken pool, start a fresh one next time
+                self._drop_convert_pool()
+            remove_partial_output(output_path)
+            self._convert_failed += 1
+            self.log(f"Conversion failed: {os.path.basename(input_path)}: {str(e)}", "#EF5350")
+            if not batch:
+                self.progress_bar.set(0)
+                self.progress_label.configure(text="✗ Conversion failed")
+                self.show_banner(f"✗ Conversion failed: {str(e)}", "err")
+            return
+        
+        # Get file sizes
+        input_size = input_st.st_size / (1024**2)
+        output_size = glb_size / (1024**2)
+        reduction = (1 - output_size/input_size) * 100
+        
+        if reused:
+            self.log(f"Up to date, not re-converted: {os.path.basename(output_path)}", "#81C784")
+        else:
+            self.log(f"Conversion successful: {os.path.basename(output_path)}", "#81C784")
+        self.log(f"Size: {input_size:.2f}MB → {output_size:.2f}MB ({reduction:.1f}% reduction)", "#81C784")
+        
+        if not batch:
             self.progress_bar.set(1.0)
             
-            # Get file sizes
-            input_size = Path(input_path).stat().st_size / (1024**2)
-            output_size = Path(output_path).stat().st_size / (1024**2)
-            reduction = (1 - output_size/input_size) * 100
-            
-            message = f"✓ Conversion complete!\n\n"
-            message += f"Input:  {input_size:.2f} MB (OBJ)\n"
-            message += f"Output: {output_size:.2f} MB (GLB)\n"
-            message += f"Size reduction: {reduction:.1f}%"
+            message = "✓ GLB already up to date" if reused else "✓ Conversion complete"
+            message += f": {input_size:.2f} MB OBJ → {output_size:.2f} MB GLB ({reduction:.1f}% smaller)"
             
             self.progress_label.configure(text="✓ Conversion complete!")
-            self.viewer_terminal.log(f"Conversion successful: {Path(output_path).name}", "#81C784")
-            self.viewer_terminal.log(f"Size: {input_size:.2f}MB → {output_size:.2f}MB ({reduction:.1f}% reduction)", "#81C784")
-            
-            messagebox.showinfo("Success", message)
-            
-        except Exception as e:
-            self.progress_bar.set(0)
-            self.progress_label.configure(text="✗ Conversion failed")
-            self.viewer_terminal.log(f"Conversion failed: {str(e)}", "#EF5350")
-            messagebox.showerror("Error", f"Conversion failed:\n{str(e)}")
+            self.show_banner(message)
+    
+    def show_banner(self, message, kind="ok"):
+        """Show a result message under the header for a few seconds (non-modal)"""
+        self.banner.configure(text=message, fg_color="#2E7D32" if kind == "ok" else "#C62828")
+        self.banner.pack(pady=(10, 5), padx=20, fill="x")
+        
+        if self._banner_job is not None:
+            self.after_cancel(self._banner_job)
+        delay = self.BANNER_MS if kind == "ok" else 2 * self.BANNER_MS
+        self._banner_job = self.after(delay, self._hide_banner)
+    
+    def _hide_banner(self):
+        self._banner_job = None
+        self.banner.pack_forget()
     
     def toggle_interactive_terminal(self):
         """Show/hide interactive terminal"""
-        if self.interactive_terminal.winfo_viewable():
+        if self.interactive_terminal is None:
+            self.interactive_terminal = InteractiveTerminal(self)
+        elif self.interactive_terminal.winfo_viewable():
             self.interactive_terminal.withdraw()
         else:
             self.interactive_terminal.deiconify()
     
     def toggle_viewer_terminal(self):
         """Show/hide viewer terminal"""
-        if self.viewer_terminal.winfo_viewable():
+        if self.viewer_terminal is not None and self.viewer_terminal.winfo_viewable():
             self.viewer_terminal.withdraw()
+        else:
+            self.show_viewer_terminal()
+    
+    def show_viewer_terminal(self):
+        """Show viewer terminal, creating it on first use"""
+        if self.viewer_terminal is None:
+            self.viewer_terminal = ViewerTerminal(self)
+            self._drain_log_queue(reschedule=False)
         else:
             self.viewer_terminal.deiconify()
     
+    def log(self, message, color="#E0E0E0"):
+        """Log to the viewer terminal (thread-safe, shown on the next drain)"""
+        self._log_queue.put((message, color, log_timestamp()))
+    
+    def _drain_log_queue(self, reschedule=True):
+        """Move queued log lines into the viewer terminal, a batch per tick"""
+        # Lines stay queued until the terminal is first opened
+        if self.viewer_terminal is not None:
+            batch = take_batch(self._log_queue)
+            if batch:
+                self.viewer_terminal.write_batch(batch)
+        
+        if reschedule:
+            self.after(LOG_DRAIN_MS, self._drain_log_queue)
+    
     def change_theme(self, theme):
         """Change application theme"""
         theme_map = {"Dark": "dark", "Light": "light", "System": "system"}
         ctk.set_appearance_mode(theme_map[theme])
-        self.viewer_terminal.log(f"Theme changed to: {theme}", "#90CAF9")
+        self.log(f"Theme changed to: {theme}", "#90CAF9")
     
     def add_to_recent(self, filepath):
         """Add file to recent list"""
@@ -1045,11 +1992,26 @@ Easy to use, powerful features
             self.recent_files.remove(filepath)
         
         self.recent_files.insert(0, filepath)
-        self.recent_files = self.recent_files[:10]
+        self.recent_files = self.recent_files[:self.MAX_RECENT]
+        self._stat_cache.pop(filepath, None)
         
         self.save_config()
         self.update_recent_files()
     
+    def _on_configure(self, event):
+        """Throttle resizes: at most one layout pass per LAYOUT_THROTTLE_MS"""
+        # Child widgets report their own <Configure> through the toplevel binding
+        if event.widget is not self:
+            return
+        # Events arriving while a pass is pending are covered by it (it reads
+        # the window size when it runs), so a drag still re-lays out as it goes
+        if self._resize_job is None:
+            self._resize_job = self.after(self.LAYOUT_THROTTLE_MS, self._do_resize)
+    
+    def _do_resize(self):
+        self._resize_job = None
+        self.update_layout_sizes()
+    
     def update_layout_sizes(self):
         """Update sizes based on window dimensions"""
         if not self.winfo_viewable():
@@ -1060,106 +2022,197 @@ Easy to use, powerful features
         # Recent files scrollable area
         if hasattr(self, 'recent_scroll'):
             recent_height = max(150, min(400, int(window_height * 0.25)))
-            self.recent_scroll.configure(height=recent_height)
+            if recent_height != self._recent_height:
+                self._recent_height = recent_height
+                self.recent_scroll.configure(height=recent_height)
     
     def update_recent_files(self):
-        """Update recent files display"""
-        # Clear existing
-        for widget in self.recent_scroll.winfo_children():
-            widget.destroy()
-        
-        if not self.recent_files:
-            ctk.CTkLabel(
-                self.recent_scroll,
-                text="No recent files",
-                text_color="#757575",
-                font=ctk.CTkFont(size=12)
-            ).pack(pady=20)
-            return
+        """Update recent files display (rows are reused, not rebuilt)"""
+        rows_by_path = {row.filepath: row for row in self._recent_rows}
+        spare_rows = self._spare_rows
+        shown_rows = []
         
         for filepath in self.recent_files:
-            if not Path(filepath).exists():
+            # One stat per file, reused for STAT_TTL seconds
+            st = self._cached_stat(filepath)
+            if st is None:
                 continue
             
-            file_frame = ctk.CTkFrame(self.recent_scroll)
-            file_frame.pack(fill="x", pady=3, padx=5)
-            
-            filename = Path(filepath).name
-            file_size = Path(filepath).stat().st_size / (1024**2)
-            
-            # Info frame
-            info_frame = ctk.CTkFrame(file_frame, fg_color="transparent")
-            info_frame.pack(side="left", fill="x", expand=True)
-            
-            # Filename
-            ctk.CTkLabel(
-                info_frame,
-                text=filename,
-                font=ctk.CTkFont(size=13),
-                anchor="w"
-            ).pack(side="top", anchor="w", padx=10, pady=(8, 2))
+            row = rows_by_path.pop(filepath, None)
+            if row is None:
+                row = spare_rows.pop() if spare_rows else RecentFileRow(self.recent_scroll, self.load_recent)
             
-            # Path and size
-            path_text = f"{str(Path(filepath).parent)[:50]}... • {file_size:.1f} MB"
-            ctk.CTkLabel(
-                info_frame,
-                text=path_text,
-                font=ctk.CTkFont(size=10),
-                text_color="#B0BEC5",
-                anchor="w"
-            ).pack(side="top", anchor="w", padx=10, pady=(0, 8))
-            
-            # Load button
-            ctk.CTkButton(
-                file_frame,
-                text="Load",
-                command=lambda p=filepath: self.load_recent(p),
-                width=90,
-                height=35
-            ).pack(side="right", padx=8, pady=5)
+            file_size = st.st_size / (1024**2)
+            path_text = f"{os.path.dirname(filepath)[:50]}... • {file_size:.1f} MB"
+            row.set_file(filepath, os.path.basename(filepath), path_text)
+            shown_rows.append(row)
+        
+        # Re-pack only from the first position whose row changed; an
+        # unchanged order (e.g. relaunching the top file) packs nothing
+        old_rows = self._recent_rows
+        first = 0
+        while first < min(len(old_rows), len(shown_rows)) and old_rows[first] is shown_rows[first]:
+            first += 1
+        for row in old_rows[first:]:
+            row.frame.pack_forget()
+        for row in shown_rows[first:]:
+            row.frame.pack(fill="x", pady=3, padx=5)
+        
+        # Rows no longer listed stay hidden until a new entry needs them
+        spare_rows.extend(rows_by_path.values())
+        self._recent_rows = shown_rows
+        
+        if shown_rows:
+            self.no_recent_label.pack_forget()
+        else:
+            self.no_recent_label.pack(pady=20)
+    
+    def _cached_stat(self, filepath):
+        """safe_stat() memoized for STAT_TTL seconds (refreshes don't re-stat)"""
+        now = time.monotonic()
+        cached = self._stat_cache.get(filepath)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        # Missing files are remembered too (as None), for MISSING_TTL
+        st = safe_stat(filepath)
+        ttl = self.STAT_TTL if st is not None else self.MISSING_TTL
+        self._stat_cache[filepath] = (now + ttl, st)
+        return st
     
     def load_recent(self, filepath):
         """Load from recent files"""
         self.model_path.set(filepath)
-        self.viewer_terminal.log(f"Loaded recent file: {Path(filepath).name}", "#4CAF50")
+        self.log(f"Loaded recent file: {os.path.basename(filepath)}", "#4CAF50")
     
     def load_config(self):
-        """Load configuration"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    self.recent_files = [f for f in config.get('recent_files', []) 
-                                        if Path(f).exists()]
-            except:
-                self.recent_files = []
+        """Load configuration without blocking the UI"""
+        threading.Thread(target=self._load_config_async, daemon=True).start()
     
-    def save_config(self):
-        """Save configuration"""
-        config = {'recent_files': self.recent_files}
+    def _load_config_async(self):
+        """Read config and stat recent files (runs in thread)"""
+        stats = {}
+        saved = None
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(self.config_file, 'rb') as f:
+                config = load_json(f.read())
+            saved = (tuple(config.get('recent_files', [])), bool(config.get('prewarm_viewer', False)))
+            for filepath in saved[0]:
+                # Only as many live entries as can be shown; skip duplicates
+                if len(stats) >= self.MAX_RECENT:
+                    break
+                if filepath in stats:
+                    continue
+                st = safe_stat(filepath)
+                if st is not None:
+                    stats[filepath] = st
         except:
             pass
+        
+        # Widgets must be touched from the Tk main thread
+        self.after(0, self._apply_config, stats, saved)
+    
+    def _apply_config(self, stats, saved=None):
+        """Merge loaded recent files and settings into the UI (runs on main thread)"""
+        # What is on disk now: an identical config later needs no write
+        self._saved_config = saved
+        expires = time.monotonic() + self.STAT_TTL
+        self._stat_cache.update((path, (expires, st)) for path, st in stats.items())
+        # Files opened while the config was loading stay on top
+        merged = self.recent_files + [f for f in stats if f not in self.recent_files]
+        self.recent_files = merged[:self.MAX_RECENT]
+        self._config_loaded = True
+        self.update_recent_files()
+        
+        # Warm up a viewer once the window is up, if the user opted in
+        if saved is not None and saved[1]:
+            self.prewarm_viewer.set(True)
+            self.after(1000, self._spawn_warm_viewer)
+    
+    def save_config(self, now=False):
+        """Save configuration (debounced, written off the Tk thread)"""
+        # Never overwrite the file with a list that hasn't been loaded yet
+        if not self._config_loaded:
+            return
+        
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+            self._save_job = None
+        
+        if now:
+            self._flush_config(background=False)
+        else:
+            # Bursts of changes collapse into one write
+            self._save_job = self.after(self.SAVE_DELAY_MS, self._flush_config)
+    
+    def _flush_config(self, background=True):
+        """Snapshot the config and write it out"""
+        self._save_job = None
+        
+        # Nothing changed since the last write (or since loading): skip it
+        snapshot = (tuple(self.recent_files), self.prewarm_viewer.get())
+        if snapshot == self._saved_config:
+            return
+        
+        self._save_seq += 1
+        config = {'recent_files': list(snapshot[0]), 'prewarm_viewer': snapshot[1]}
+        if background:
+            threading.Thread(
+                target=self._write_config,
+                args=(config, self._save_seq),
+                daemon=True
+            ).start()
+        else:
+            self._write_config(config, self._save_seq)
+    
+    def _write_config(self, config, seq):
+        """Write a config snapshot to disk (any thread)"""
+        with self._save_lock:
+            # A newer snapshot already landed: don't roll it back
+            if seq <= self._saved_seq:
+                return
+            try:
+                # Write to a temp file and swap it in, so a crash never truncates the config
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=str(self.config_file.parent), prefix='.3d_viewer_config', suffix='.tmp'
+                )
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(dump_json(config))
+                    os.replace(tmp_path, self.config_file)
+                except:
+                    os.unlink(tmp_path)
+                    raise
+                self._saved_seq = seq
+                self._saved_config = (tuple(config['recent_files']), config['prewarm_viewer'])
+            except:
+                pass
     
     def on_closing(self):
         """Handle window close"""
-        # Kill viewer process if running
+        # Stop the viewer's whole process group, so no helper outlives the GUI
         if self.viewer_process and self.viewer_process.poll() is None:
-            self.viewer_process.terminate()
-        
-        self.save_config()
-        self.interactive_terminal.destroy()
-        self.viewer_terminal.destroy()
+            stop_process_group(self.viewer_process)
+        self._stop_warm_viewer()
+        self._stop_converter()
+        
+        self.save_config(now=True)
+        if self.interactive_terminal is not None:
+            self.interactive_terminal.destroy()
+        if self.viewer_terminal is not None:
+            self.viewer_terminal.destroy()
         self.destroy()
 
 
 if __name__ == '__main__':
-    # Check dependencies
+    # Frozen builds: let converter worker processes start up properly
+    multiprocessing.freeze_support()
+    
+    # Check dependencies (trimesh is only located, not imported, at startup)
     try:
         import customtkinter
-        import trimesh
+        if importlib.util.find_spec("trimesh") is None:
+            raise ImportError("No module named 'trimesh'")
     except ImportError as e:
         print(f"ERROR: Missing dependency: {e}")
         print("\nInstall with:")
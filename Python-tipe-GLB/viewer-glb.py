@@ -7,8 +7,17 @@ Optimized for large files (2GB+)
 
 import sys
 import os
+import json
+import math
+import threading
 import time
+import ctypes
+import mmap
+import hashlib
+import tempfile
+import importlib.util
 from pathlib import Path
+from types import SimpleNamespace
 
 # FIX per Windows: forza UTF-8 per stdout/stderr
 if sys.platform == 'win32':
@@ -19,17 +28,22 @@ if sys.platform == 'win32':
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
 
+def pause_before_exit():
+    """Keep the console open on errors, only when someone is at it (not GUI/pre-warmed launches)"""
+    if sys.stdin is not None and sys.stdin.isatty():
+        input("\nPress Enter to exit...")
+
 
 try:
     import pyglet
     from pyglet.window import key, mouse
     from pyglet import image
     from pyglet.graphics import Batch
-    from pyglet.math import Mat4, Vec3
+    from pyglet.math import Mat4
 except ImportError:
     print("ERROR: pyglet not installed!")
     print("Install with: pip install pyglet")
-    input("Press Enter to exit...")
+    pause_before_exit()
     sys.exit(1)
 
 try:
@@ -38,10 +52,583 @@ try:
 except ImportError:
     print("ERROR: trimesh not installed!")
     print("Install with: pip install trimesh")
-    input("Press Enter to exit...")
+    pause_before_exit()
     sys.exit(1)
 
 
+# Shared identity matrix (Mat4 is immutable, so one instance is enough)
+IDENTITY = Mat4()
+
+# Rendering is on demand; only the loading screen refreshes on a timer
+LOADING_REDRAW_INTERVAL = 1 / 10
+
+# The mesh is uploaded in slices between loading-screen frames
+UPLOAD_CHUNK_BYTES = 64 * 1024**2
+
+# Vertices are centered and scaled into [-POSITION_EXTENT, POSITION_EXTENT],
+# then stored as snorm16 of position / POSITION_EXTENT; the model matrix
+# scales them back up
+POSITION_EXTENT = 2.0
+POSITION_MATRIX = Mat4(
+    POSITION_EXTENT, 0.0, 0.0, 0.0,
+    0.0, POSITION_EXTENT, 0.0, 0.0,
+    0.0, 0.0, POSITION_EXTENT, 0.0,
+    0.0, 0.0, 0.0, 1.0
+)
+
+
+def make_view_matrix(rot_x, rot_y, distance, pan_x, pan_y):
+    """
+    Camera view T(pan_x, pan_y, -distance) * Rx(rot_x) * Ry(rot_y), built in
+    one step from two sin/cos pairs instead of chained Mat4 translate/rotate
+    """
+    sx, cx = math.sin(math.radians(rot_x)), math.cos(math.radians(rot_x))
+    sy, cy = math.sin(math.radians(rot_y)), math.cos(math.radians(rot_y))
+    # Column-major, like Mat4
+    return Mat4(
+        cy, sx * sy, -cx * sy, 0.0,
+        0.0, cx, sx, 0.0,
+        sy, -sx * cy, cx * cy, 0.0,
+        pan_x, pan_y, -distance, 1.0
+    )
+
+
+# GL component type for each packed vertex attribute dtype. Integer types are
+# read back normalized (int8/int16 -> [-1, 1], uint8/uint16 -> [0, 1]).
+VERTEX_GL_TYPES = {
+    np.dtype(np.float32): pyglet.gl.GL_FLOAT,
+    np.dtype(np.int8): pyglet.gl.GL_BYTE,
+    np.dtype(np.int16): pyglet.gl.GL_SHORT,
+    np.dtype(np.uint8): pyglet.gl.GL_UNSIGNED_BYTE,
+    np.dtype(np.uint16): pyglet.gl.GL_UNSIGNED_SHORT,
+}
+
+
+def quantize_attributes(verts, normals, colors, uvs):
+    """Pack vertex attributes into compact types (20 bytes/vertex instead of 44)"""
+    # Positions are normalized to [-2, 2] and normals are unit vectors.
+    # Scaling/rounding reuse one float32 scratch array per attribute.
+    # snorm16 positions: 16x finer than fp16 near the edges, same size
+    scaled_verts = np.multiply(verts, 32767 / POSITION_EXTENT, dtype=np.float32)
+    np.rint(scaled_verts, out=scaled_verts)
+    scaled_normals = np.clip(normals, -1.0, 1.0, dtype=np.float32)
+    np.multiply(scaled_normals, 127, out=scaled_normals)
+    np.rint(scaled_normals, out=scaled_normals)
+    packed = {
+        'position': scaled_verts.astype(np.int16),
+        'normal': scaled_normals.astype(np.int8),
+        'color': colors,
+    }
+    
+    # Texture atlases can be 8k+ wide: fp16 UVs would be off by several
+    # texels, normalized uint16 keeps 1/65535 precision
+    if uvs.size and uvs.min() >= 0.0 and uvs.max() <= 1.0:
+        scaled_uvs = np.multiply(uvs, 65535, dtype=np.float32)
+        np.rint(scaled_uvs, out=scaled_uvs)
+        packed['texcoord'] = scaled_uvs.astype(np.uint16)
+    else:
+        packed['texcoord'] = uvs.astype(np.float32, copy=False)
+    return packed
+
+
+def interleave_attributes(packed, names):
+    """
+    One structured array holding the packed attributes listed in names, so
+    each vertex fetch reads a single small record
+    """
+    fields = [(name, data) for name, data in packed.items() if name in names]
+    
+    # Pad each field to a 4-byte boundary (e.g. 3 x int16 -> 4 x int16)
+    layout = np.dtype([
+        (name, data.dtype, (-(-data.shape[1] * data.itemsize // 4) * 4 // data.itemsize,))
+        for name, data in fields
+    ])
+    interleaved = np.zeros(len(packed['position']), dtype=layout)
+    for name, data in fields:
+        interleaved[name][:, :data.shape[1]] = data
+    return interleaved
+
+
+# Optional Numba kernels for mesh preprocessing. numba is imported and the
+# kernels compiled (or loaded from the on-disk cache) only for big meshes.
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+NUMBA_MIN_VERTICES = 1_000_000
+_mesh_kernels = None
+
+
+def mesh_kernels():
+    """Build the Numba mesh kernels on first use"""
+    global _mesh_kernels
+    if _mesh_kernels is None:
+        import numba
+        
+        # Frozen builds have no source files to key the cache on
+        jit = numba.njit(parallel=True, fastmath=True, cache=not getattr(sys, 'frozen', False))
+        
+        @jit
+        def center_and_scale(verts):
+            n = verts.shape[0]
+            sx = 0.0
+            sy = 0.0
+            sz = 0.0
+            for i in numba.prange(n):
+                sx += verts[i, 0]
+                sy += verts[i, 1]
+                sz += verts[i, 2]
+            cx = np.float32(sx / n)
+            cy = np.float32(sy / n)
+            cz = np.float32(sz / n)
+            
+            max_extent = np.float32(0.0)
+            for i in numba.prange(n):
+                d = max(abs(verts[i, 0] - cx), abs(verts[i, 1] - cy), abs(verts[i, 2] - cz))
+                max_extent = max(max_extent, d)
+            
+            scale = np.float32(POSITION_EXTENT / max_extent) if max_extent > 0 else np.float32(1.0)
+            for i in numba.prange(n):
+                verts[i, 0] = (verts[i, 0] - cx) * scale
+                verts[i, 1] = (verts[i, 1] - cy) * scale
+                verts[i, 2] = (verts[i, 2] - cz) * scale
+        
+        @jit
+        def vertex_normals(verts, faces):
+            normals = np.zeros_like(verts)
+            # Serial scatter (faces share vertices), then a parallel normalize
+            for f in range(faces.shape[0]):
+                a, b, c = faces[f, 0], faces[f, 1], faces[f, 2]
+                e1x = verts[b, 0] - verts[a, 0]
+                e1y = verts[b, 1] - verts[a, 1]
+                e1z = verts[b, 2] - verts[a, 2]
+                e2x = verts[c, 0] - verts[a, 0]
+                e2y = verts[c, 1] - verts[a, 1]
+                e2z = verts[c, 2] - verts[a, 2]
+                nx = e1y * e2z - e1z * e2y
+                ny = e1z * e2x - e1x * e2z
+                nz = e1x * e2y - e1y * e2x
+                for v in (a, b, c):
+                    normals[v, 0] += nx
+                    normals[v, 1] += ny
+                    normals[v, 2] += nz
+            
+            for i in numba.prange(normals.shape[0]):
+                length = np.sqrt(normals[i, 0] ** 2 + normals[i, 1] ** 2 + normals[i, 2] ** 2)
+                if length > 0:
+                    normals[i, 0] /= length
+                    normals[i, 1] /= length
+                    normals[i, 2] /= length
+            return normals
+        
+        _mesh_kernels = SimpleNamespace(center_and_scale=center_and_scale, vertex_normals=vertex_normals)
+    return _mesh_kernels
+
+
+def compiled_kernel(name, *args):
+    """
+    Numba mesh kernel compiled for these arguments, or None to use NumPy.
+    Any failure disables Numba for the rest of the session.
+    """
+    global HAS_NUMBA
+    if not HAS_NUMBA:
+        return None
+    try:
+        import numba
+        kernel = getattr(mesh_kernels(), name)
+        # Numba compiles (or loads its cache) lazily on the first call: do it
+        # now, so errors surface here and before any data is modified
+        kernel.compile(tuple(numba.typeof(arg) for arg in args))
+        return kernel
+    except Exception as e:
+        print(f"⚠ Numba unavailable, using NumPy: {e}")
+        HAS_NUMBA = False
+        return None
+
+
+def center_and_scale(verts):
+    """
+    Center vertices on the origin and scale them into [-2, 2].
+    Returns float32 vertices; float32 writable input is updated in place.
+    """
+    in_place = verts.dtype == np.float32 and verts.flags.writeable
+    
+    if HAS_NUMBA and len(verts) >= NUMBA_MIN_VERTICES:
+        # Three parallel passes over the array, updated in place (only the
+        # last one writes, after the kernel compiled)
+        work = np.ascontiguousarray(verts) if in_place else np.array(verts, dtype=np.float32)
+        kernel = compiled_kernel('center_and_scale', work)
+        if kernel is not None:
+            try:
+                kernel(work)
+                return work
+            except Exception as e:  # Raised before the writing pass
+                print(f"⚠ Numba kernel failed, using NumPy: {e}")
+        if not in_place:
+            verts = work  # Already a float32 copy, reuse it
+            in_place = True
+    
+    # No temporaries the size of the vertex array: float64 (trimesh) input
+    # is converted by the subtraction itself instead of a separate copy
+    out = verts if in_place else np.empty(verts.shape, dtype=np.float32)
+    np.subtract(verts, verts.mean(axis=0), out=out)
+    verts = out
+    max_extent = max(verts.max(), -verts.min())
+    if max_extent > 0:
+        np.multiply(verts, np.float32(POSITION_EXTENT / max_extent), out=verts)
+    return verts
+
+
+def compute_vertex_normals(verts, faces):
+    """Area-weighted unit vertex normals for a triangle mesh"""
+    if HAS_NUMBA and len(verts) >= NUMBA_MIN_VERTICES:
+        v = np.ascontiguousarray(verts)
+        f = np.ascontiguousarray(faces)
+        kernel = compiled_kernel('vertex_normals', v, f)
+        if kernel is not None:
+            try:
+                return kernel(v, f)
+            except Exception as e:  # Inputs are read-only, NumPy can take over
+                print(f"⚠ Numba kernel failed, using NumPy: {e}")
+    
+    # Face normals (length = 2x area), summed per vertex with bincount,
+    # which is much faster than np.add.at for scattered adds
+    v0, v1, v2 = verts[faces[:, 0]], verts[faces[:, 1]], verts[faces[:, 2]]
+    face_normals = np.cross(v1 - v0, v2 - v0)
+    corners = faces.ravel()
+    normals = np.empty_like(verts)
+    for axis in range(3):
+        normals[:, axis] = np.bincount(corners, weights=np.repeat(face_normals[:, axis], 3), minlength=len(verts))
+    
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return normals / norms
+
+
+# glTF accessor layouts for the direct GLB reader
+GLTF_COMPONENT_TYPES = {
+    5120: np.int8, 5121: np.uint8, 5122: np.int16,
+    5123: np.uint16, 5125: np.uint32, 5126: np.float32,
+}
+GLTF_TYPE_WIDTHS = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4}
+
+
+def read_gltf_accessor(gltf, binary, index):
+    """Zero-copy (strided) NumPy view of a glTF accessor in the BIN chunk"""
+    accessor = gltf['accessors'][index]
+    if 'sparse' in accessor:
+        raise ValueError("sparse accessors are not supported")
+    view = gltf['bufferViews'][accessor['bufferView']]
+    if view.get('buffer', 0) != 0:
+        raise ValueError("external buffers are not supported")
+    
+    dtype = np.dtype(GLTF_COMPONENT_TYPES[accessor['componentType']])
+    width = GLTF_TYPE_WIDTHS[accessor['type']]
+    stride = view.get('byteStride') or dtype.itemsize * width
+    data = np.ndarray(
+        (accessor['count'], width), dtype=dtype, buffer=binary,
+        offset=view.get('byteOffset', 0) + accessor.get('byteOffset', 0),
+        strides=(stride, dtype.itemsize)
+    )
+    
+    # Normalized integers map to [0, 1] / [-1, 1]
+    if accessor.get('normalized'):
+        data = np.maximum(data.astype(np.float32) / np.iinfo(dtype).max, -1.0)
+    return data
+
+
+def read_glb_arrays(path):
+    """
+    Read vertex arrays straight from a GLB's binary chunk, skipping trimesh's
+    scene building. Returns None for layouts this reader doesn't handle
+    (several mesh nodes, rotations, compression...).
+    """
+    # Memory-mapped: only the pages the accessors touch are read, not the
+    # whole file (embedded textures are often most of a GLB)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < 20:
+            return None
+        data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    if bytes(data[:4]) != b'glTF':
+        return None
+    
+    # Chunks: JSON first, then (optionally) BIN
+    json_length = int.from_bytes(data[12:16], 'little')
+    gltf = json.loads(bytes(data[20:20 + json_length]))
+    binary = b''
+    bin_start = 20 + json_length
+    if len(data) >= bin_start + 8 and bytes(data[bin_start + 4:bin_start + 8]) == b'BIN\x00':
+        bin_length = int.from_bytes(data[bin_start:bin_start + 4], 'little')
+        binary = data[bin_start + 8:bin_start + 8 + bin_length]
+    
+    if set(gltf.get('extensionsRequired', [])) - {'KHR_mesh_quantization'}:
+        return None
+    
+    # A single mesh node; translation and uniform scale anywhere in the
+    # hierarchy are fine since the viewer re-centers and re-scales anyway
+    nodes = gltf.get('nodes', [])
+    if sum('mesh' in node for node in nodes) != 1:
+        return None
+    for node in nodes:
+        scale = node.get('scale', [1.0, 1.0, 1.0])
+        if ('matrix' in node or node.get('rotation', [0.0, 0.0, 0.0, 1.0]) != [0.0, 0.0, 0.0, 1.0]
+                or not scale[0] == scale[1] == scale[2] > 0):
+            return None
+    mesh = gltf['meshes'][next(node['mesh'] for node in nodes if 'mesh' in node)]
+    
+    primitives = mesh['primitives']
+    keys = set(primitives[0]['attributes'])
+    if 'POSITION' not in keys:
+        return None
+    if any(p.get('mode', 4) != 4 or set(p['attributes']) != keys or 'targets' in p for p in primitives):
+        return None
+    
+    parts = []
+    for primitive in primitives:
+        attributes = primitive['attributes']
+        positions = read_gltf_accessor(gltf, binary, attributes['POSITION'])
+        part = {
+            'vertices': positions,
+            'normals': read_gltf_accessor(gltf, binary, attributes['NORMAL']) if 'NORMAL' in attributes else None,
+            'colors': None,
+            'uvs': None,
+        }
+        
+        if 'COLOR_0' in attributes:
+            color = read_gltf_accessor(gltf, binary, attributes['COLOR_0'])[:, :3]
+            if color.dtype != np.uint8:
+                color = np.round(np.clip(color, 0.0, 1.0) * 255).astype(np.uint8)
+            part['colors'] = color
+        
+        if 'TEXCOORD_0' in attributes:
+            uv = read_gltf_accessor(gltf, binary, attributes['TEXCOORD_0']).astype(np.float32)
+            uv[:, 1] = 1.0 - uv[:, 1]  # glTF UV origin is top-left
+            part['uvs'] = uv
+        
+        if 'indices' in primitive:
+            part['faces'] = read_gltf_accessor(gltf, binary, primitive['indices']).reshape(-1, 3)
+        else:
+            part['faces'] = np.arange(len(positions)).reshape(-1, 3)
+        parts.append(part)
+    
+    return merge_mesh_arrays(parts)
+
+
+def mesh_arrays(mesh):
+    """Vertex arrays of a trimesh mesh, in the same form as read_glb_arrays"""
+    visual = mesh.visual
+    return {
+        'vertices': mesh.vertices,
+        'faces': mesh.faces,
+        'normals': getattr(mesh, 'vertex_normals', None),
+        'colors': visual.vertex_colors[:, :3] if getattr(visual, 'vertex_colors', None) is not None else None,
+        'uvs': getattr(visual, 'uv', None),
+    }
+
+
+def merge_mesh_arrays(parts):
+    """
+    Concatenate per-geometry arrays into one mesh (indices offset per part).
+    Much cheaper than trimesh.util.concatenate, which also merges visuals and
+    materials. The result always has fresh, writable float32 vertices.
+    """
+    counts = [len(part['vertices']) for part in parts]
+    offsets = np.cumsum([0] + counts[:-1]).tolist()
+    
+    def merged(name, fill):
+        if all(part[name] is None for part in parts):
+            return None
+        return np.concatenate([
+            fill(count) if part[name] is None else np.asarray(part[name])
+            for part, count in zip(parts, counts)
+        ])
+    
+    return {
+        'vertices': np.concatenate([np.asarray(part['vertices']) for part in parts], dtype=np.float32),
+        'faces': np.concatenate([
+            np.asarray(part['faces']).astype(np.uint32) + offset
+            for part, offset in zip(parts, offsets)
+        ]),
+        'normals': merged('normals', lambda count: np.zeros((count, 3), dtype=np.float32)),
+        'colors': merged('colors', lambda count: np.full((count, 3), 191, dtype=np.uint8)),
+        'uvs': merged('uvs', lambda count: np.zeros((count, 2), dtype=np.float32)),
+    }
+
+
+# Linked shader programs are cached per driver (glGetProgramBinary), so later
+# launches skip GLSL compilation
+SHADER_CACHE_DIR = Path.home() / '.cache' / 'viewer-glb'
+
+# load_program_binary rebuilds a ShaderProgram from pyglet internals (as of
+# pyglet 2.1); without them the cache is skipped rather than failing each run
+HAS_PROGRAM_INTROSPECTION = all(
+    hasattr(pyglet.graphics.shader, name)
+    for name in ('_introspect_attributes', '_introspect_uniforms', '_introspect_uniform_blocks')
+)
+
+
+def build_shader_program(vertex_source, fragment_source):
+    """Link a ShaderProgram, reusing the program binary from an earlier run when possible"""
+    shader = pyglet.graphics.shader
+    info = pyglet.gl.current_context.get_info()
+    
+    cache_file = None
+    if HAS_PROGRAM_INTROSPECTION and (info.have_version(4, 1) or info.have_extension('GL_ARB_get_program_binary')):
+        key = '\0'.join((info.get_vendor(), info.get_renderer(), info.get_version_string(),
+                         pyglet.version, vertex_source, fragment_source))
+        cache_file = SHADER_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.bin"
+        program = load_program_binary(cache_file)
+        if program is not None:
+            return program
+    
+    program = shader.ShaderProgram(
+        shader.Shader(vertex_source, 'vertex'),
+        shader.Shader(fragment_source, 'fragment')
+    )
+    if cache_file is not None:
+        save_program_binary(program.id, cache_file)
+    return program
+
+
+def load_program_binary(cache_file):
+    """ShaderProgram from a cached binary, or None if missing or rejected by the driver"""
+    try:
+        blob = cache_file.read_bytes()
+    except OSError:
+        return None
+    
+    gl = pyglet.gl
+    shader = pyglet.graphics.shader
+    program_id = gl.glCreateProgram()
+    program = None
+    try:
+        data = ctypes.create_string_buffer(blob[4:], len(blob) - 4)
+        gl.glProgramBinary(program_id, int.from_bytes(blob[:4], 'little'), data, len(data))
+        status = gl.GLint()
+        gl.glGetProgramiv(program_id, gl.GL_LINK_STATUS, status)
+        if not status.value:
+            raise ValueError("stale program binary")
+        
+        # Same setup as ShaderProgram.__init__, minus compiling and linking
+        program = shader.ShaderProgram.__new__(shader.ShaderProgram)
+        program._id = None
+        program._context = pyglet.gl.current_context
+        info = program._context.get_info()
+        have_dsa = info.have_version(4, 1) or info.have_extension('GL_ARB_separate_shader_objects')
+        program._attributes = shader._introspect_attributes(program_id)
+        program._uniforms = shader._introspect_uniforms(program_id, have_dsa)
+        program._id = program_id
+        program._uniform_blocks = shader._introspect_uniform_blocks(program)
+        return program
+    except Exception:
+        if program is not None:
+            program._id = None  # Keep its finalizer off the deleted id
+        gl.glDeleteProgram(program_id)
+        return None
+
+
+def save_program_binary(program_id, cache_file):
+    """Store a linked program's binary for the next launch (best effort)"""
+    gl = pyglet.gl
+    length = gl.GLint()
+    gl.glGetProgramiv(program_id, gl.GL_PROGRAM_BINARY_LENGTH, length)
+    if length.value <= 0:
+        return
+    
+    data = ctypes.create_string_buffer(length.value)
+    written = gl.GLsizei()
+    binary_format = gl.GLenum()
+    gl.glGetProgramBinary(program_id, length.value, written, binary_format, data)
+    try:
+        SHADER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(binary_format.value.to_bytes(4, 'little') + data.raw[:written.value])
+    except OSError:
+        pass
+
+
+# Processed (quantized) mesh arrays of big models, keyed on the file's path,
+# size and mtime. Bump the version when the array layout changes. Entries are
+# evicted least recently used first (hits refresh the mtime) past the cap
+MESH_CACHE_DIR = SHADER_CACHE_DIR / 'meshes'
+MESH_CACHE_VERSION = 2
+MESH_CACHE_MIN_BYTES = 16 * 1024**2
+MESH_CACHE_MAX_BYTES = 4 * 1024**3
+MESH_CACHE_STALE_TMP_SECONDS = 3600  # Leftovers of interrupted writes
+
+
+def mesh_cache_file(model_path):
+    """Cache file for a model's processed arrays, or None for small models"""
+    stat = os.stat(model_path)
+    if stat.st_size < MESH_CACHE_MIN_BYTES:
+        return None
+    key = '\0'.join((str(Path(model_path).resolve()), str(stat.st_size), str(stat.st_mtime_ns),
+                     str(MESH_CACHE_VERSION)))
+    return MESH_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.npz"
+
+
+def load_mesh_cache(cache_file):
+    """Arrays saved by save_mesh_cache, or None if missing or unreadable"""
+    try:
+        with np.load(cache_file) as data:
+            arrays = {name: data[name] for name in data.files}
+    except Exception:
+        return None
+    
+    try:
+        os.utime(cache_file)  # Mark as recently used
+    except OSError:
+        pass
+    return arrays
+
+
+def save_mesh_cache(cache_file, arrays):
+    """Store processed arrays for the next launch (best effort, atomic)"""
+    temp_file = None
+    try:
+        MESH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Unique temp name: several viewers may cache the same model at once
+        fd, temp_file = tempfile.mkstemp(suffix='.tmp', dir=MESH_CACHE_DIR)
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        if temp_file is not None:
+            Path(temp_file).unlink(missing_ok=True)
+        return
+    prune_mesh_cache(keep=cache_file)
+
+
+def prune_mesh_cache(keep):
+    """Delete stale temp files, then the least recently used entries over the size cap"""
+    now = time.time()
+    entries = []
+    for path in MESH_CACHE_DIR.iterdir():
+        try:
+            stat = path.stat()
+            if path.suffix == '.tmp':
+                if now - stat.st_mtime > MESH_CACHE_STALE_TMP_SECONDS:
+                    path.unlink()
+            elif path.suffix == '.npz':
+                entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            pass  # Removed by another viewer meanwhile
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= MESH_CACHE_MAX_BYTES:
+            break
+        if path == keep:
+            continue
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
+
+
+def set_label_text(label, text):
+    """Update a label only when its text changes (setting it re-lays out glyphs)"""
+    if label.text != text:
+        label.text = text
+
+
 class UniversalViewer:
 
 
@@ -86,20 +673,29 @@ class UniversalViewer:
         self.pan_x = 0.0
         self.pan_y = 0.0
         
-        # Model
-        self.vertex_list = None
+        # Cached matrices, rebuilt in update_matrices() when flagged dirty
+        self.projection = self.projection_2d = self.view = None
+        self.model_matrix = POSITION_MATRIX
+        self._projection_dirty = True
+        self._view_dirty = True
+        
+        # Model (raw GL objects, filled straight from NumPy arrays)
+        self.mesh_vao = None
+        self.mesh_buffers = []
+        self.index_count = 0
+        self.index_type = pyglet.gl.GL_UNSIGNED_INT
         self.vertex_count = 0
+        self.vertex_bytes = 0
         self.texture = None
         self.has_texture = False
         
         # Grid
         self.grid_vertex_list = None
-        self.grid_shader = None
         
         # UI
-        self.ui_shader = None
-        self.ui_bg_top = None
-        self.ui_bg_bottom = None
+        self.flat_shader = None
+        self.ui_bg = None
+        self._last_stats = None
         
         # State
         self.loaded = False
@@ -122,15 +718,33 @@ class UniversalViewer:
         self.window.on_mouse_scroll = self.on_scroll
         self.window.on_key_press = self.on_key
         self.window.on_resize = self.on_resize
+        self.window.on_expose = self.request_redraw
+        
+        # Redraw on demand: only input, resizes and loading progress repaint
+        self._redraw_pending = False
         
         # Setup
         self.setup_gl()
         self.create_shaders()
         self.create_grid()
         self.create_ui_backgrounds()
+        self.create_labels()
+        
+        # Find/decode the texture in the background while the model loads
+        self._texture_image = None
+        self._texture_thread = threading.Thread(target=self.find_and_decode_texture, daemon=True)
+        self._texture_thread.start()
         
-        # Load model
-        pyglet.clock.schedule_once(self.load_model, 0.1)
+        # Read/process the model in the background; the loading screen polls
+        # for it on a timer, then uploads it to the GPU a slice per frame
+        self._pending_mesh = None
+        self._mesh_upload = None
+        self._load_start = time.time()
+        self._upload_start = None
+        self._cache_thread = None
+        self._load_thread = threading.Thread(target=self.load_model, daemon=True)
+        self._load_thread.start()
+        pyglet.clock.schedule_interval(self.poll_loading, LOADING_REDRAW_INTERVAL)
     
     def setup_gl(self):
         """Setup OpenGL state"""
@@ -142,6 +756,38 @@ class UniversalViewer:
         pyglet.gl.glBlendFunc(pyglet.gl.GL_SRC_ALPHA, pyglet.gl.GL_ONE_MINUS_SRC_ALPHA)
         pyglet.gl.glLineWidth(1.5)
         pyglet.gl.glClearColor(0.1, 0.12, 0.15, 1.0)
+        
+        # Last state set through the setters below, so unchanged state costs no GL call
+        self._gl_state = {
+            pyglet.gl.GL_DEPTH_TEST: True,
+            pyglet.gl.GL_CULL_FACE: True,
+            pyglet.gl.GL_BLEND: True,
+            'depth_mask': True,
+            'polygon_mode': pyglet.gl.GL_FILL,
+        }
+    
+    def set_enabled(self, capability, enabled):
+        """glEnable/glDisable a capability if it isn't already in that state"""
+        if self._gl_state[capability] != enabled:
+            self._gl_state[capability] = enabled
+            (pyglet.gl.glEnable if enabled else pyglet.gl.glDisable)(capability)
+    
+    def set_depth_mask(self, enabled):
+        """glDepthMask, skipped if unchanged"""
+        if self._gl_state['depth_mask'] != enabled:
+            self._gl_state['depth_mask'] = enabled
+            pyglet.gl.glDepthMask(pyglet.gl.GL_TRUE if enabled else pyglet.gl.GL_FALSE)
+    
+    def set_polygon_mode(self, mode):
+        """glPolygonMode for both faces, skipped if unchanged"""
+        if self._gl_state['polygon_mode'] != mode:
+            self._gl_state['polygon_mode'] = mode
+            pyglet.gl.glPolygonMode(pyglet.gl.GL_FRONT_AND_BACK, mode)
+    
+    def draw_text(self, drawable):
+        """Draw pyglet text (its groups disable blending when done)"""
+        drawable.draw()
+        self._gl_state[pyglet.gl.GL_BLEND] = False
     
     def create_shaders(self):
         """Create shader programs"""
@@ -202,84 +848,55 @@ class UniversalViewer:
         }
         """
         
-        self.shader = pyglet.graphics.shader.ShaderProgram(
-            pyglet.graphics.shader.Shader(vertex_source, 'vertex'),
-            pyglet.graphics.shader.Shader(fragment_source, 'fragment')
-        )
+        self.shader = build_shader_program(vertex_source, fragment_source)
         
-        # Grid shader
-        grid_vs = """
+        # Flat shader: per-vertex RGBA, no lighting. Shared by the grid (3D
+        # camera) and the UI backgrounds (2D projection, identity view).
+        flat_vs = """
         #version 330 core
         in vec3 position;
-        in vec3 color;
-        out vec3 v_color;
+        in vec4 color;
+        out vec4 v_color;
         uniform mat4 projection;
         uniform mat4 view;
-        uniform mat4 model;
         void main() {
-            gl_Position = projection * view * model * vec4(position, 1.0);
+            gl_Position = projection * view * vec4(position, 1.0);
             v_color = color;
         }
         """
         
-        grid_fs = """
-        #version 330 core
-        in vec3 v_color;
-        out vec4 fragColor;
-        void main() {
-            fragColor = vec4(v_color, 1.0);
-        }
-        """
-        
-        self.grid_shader = pyglet.graphics.shader.ShaderProgram(
-            pyglet.graphics.shader.Shader(grid_vs, 'vertex'),
-            pyglet.graphics.shader.Shader(grid_fs, 'fragment')
-        )
-        
-        # UI shader
-        ui_vs = """
-        #version 330 core
-        in vec2 position;
-        uniform mat4 projection;
-        void main() {
-            gl_Position = projection * vec4(position, 0.0, 1.0);
-        }
-        """
-        
-        ui_fs = """
+        flat_fs = """
         #version 330 core
+        in vec4 v_color;
         out vec4 fragColor;
-        uniform vec4 color;
         void main() {
-            fragColor = color;
+            fragColor = v_color;
         }
         """
         
-        self.ui_shader = pyglet.graphics.shader.ShaderProgram(
-            pyglet.graphics.shader.Shader(ui_vs, 'vertex'),
-            pyglet.graphics.shader.Shader(ui_fs, 'fragment')
-        )
+        self.flat_shader = build_shader_program(flat_vs, flat_fs)
     
     def create_grid(self):
         """Create reference grid"""
         grid_size = 10
         grid_spacing = 0.5
-        vertices = []
-        colors = []
-        
-        for i in range(-grid_size, grid_size + 1):
-            z = i * grid_spacing
-            vertices.extend([-grid_size * grid_spacing, 0, z, grid_size * grid_spacing, 0, z])
-            col = [0.5, 0.5, 0.5] if i == 0 else [0.3, 0.3, 0.3]
-            colors.extend(col * 2)
-        
-        for i in range(-grid_size, grid_size + 1):
-            x = i * grid_spacing
-            vertices.extend([x, 0, -grid_size * grid_spacing, x, 0, grid_size * grid_spacing])
-            col = [0.5, 0.5, 0.5] if i == 0 else [0.3, 0.3, 0.3]
-            colors.extend(col * 2)
-        
-        self.grid_vertex_list = self.grid_shader.vertex_list(
+        half = grid_size * grid_spacing
+        
+        # One line per step along each axis: (line, endpoint, xyz)
+        steps = np.arange(-grid_size, grid_size + 1)
+        offsets = (steps * grid_spacing).astype(np.float32)
+        lines_x = np.zeros((len(steps), 2, 3), dtype=np.float32)
+        lines_x[:, :, 0] = (-half, half)
+        lines_x[:, :, 2] = offsets[:, None]
+        lines_z = lines_x[:, :, ::-1]  # Same lines with x and z swapped
+        vertices = np.concatenate((lines_x, lines_z)).ravel()
+        
+        # Center lines brighter, all opaque
+        line_colors = np.ones((len(steps), 2, 4), dtype=np.float32)
+        line_colors[:, :, :3] = np.where(steps == 0, 0.5, 0.3)[:, None, None]
+        colors = np.concatenate((line_colors, line_colors)).ravel()
+        
+        self.grid_vertex_list = self.flat_shader.vertex_list(
             len(vertices) // 3,
             pyglet.gl.GL_LINES,
             position=('f', vertices),
@@ -287,39 +904,114 @@ class UniversalViewer:
         )
     
     def create_ui_backgrounds(self):
-        """Create UI background rectangles"""
+        """Create UI background rectangles (top and bottom bar in one vertex list)"""
+        self.ui_bg = self.flat_shader.vertex_list(
+            12, pyglet.gl.GL_TRIANGLES,
+            position='f',
+            color=('f', (0.0, 0.0, 0.0, 0.75) * 12)
+        )
         self.update_ui_backgrounds()
     
     def update_ui_backgrounds(self):
-        """Update UI backgrounds for window size"""
+        """Update UI backgrounds for window size (rewrites the existing buffer)"""
         top_verts = [
-            0, self.window.height - 60, self.window.width, self.window.height - 60,
-            self.window.width, self.window.height, 0, self.window.height - 60,
-            self.window.width, self.window.height, 0, self.window.height
+            0, self.window.height - 60, 0, self.window.width, self.window.height - 60, 0,
+            self.window.width, self.window.height, 0, 0, self.window.height - 60, 0,
+            self.window.width, self.window.height, 0, 0, self.window.height, 0
         ]
         
         bottom_verts = [
-            0, 0, self.window.width, 0, self.window.width, 55,
-            0, 0, self.window.width, 55, 0, 55
+            0, 0, 0, self.window.width, 0, 0, self.window.width, 55, 0,
+            0, 0, 0, self.window.width, 55, 0, 0, 55, 0
         ]
         
-        self.ui_bg_top = self.ui_shader.vertex_list(6, pyglet.gl.GL_TRIANGLES, position=('f', top_verts))
-        self.ui_bg_bottom = self.ui_shader.vertex_list(6, pyglet.gl.GL_TRIANGLES, position=('f', bottom_verts))
+        self.ui_bg.position = top_verts + bottom_verts
+    
+    def create_labels(self):
+        """Create the text labels once (frames only update their text)"""
+        self.loading_batch = Batch()
+        self.ui_batch = Batch()
+        
+        # Loading screen
+        self.title_label = pyglet.text.Label('Loading 3D Model', font_name='Consolas', font_size=26,
+            anchor_x='center', anchor_y='center', color=(255,255,255,255), batch=self.loading_batch)
+        self.loading_label = pyglet.text.Label('', font_name='Consolas', font_size=18,
+            anchor_x='center', anchor_y='center', color=(220,220,220,255), batch=self.loading_batch)
+        self.info_label = pyglet.text.Label('', font_name='Consolas', font_size=14,
+            anchor_x='center', anchor_y='center', color=(180,180,180,255), batch=self.loading_batch)
+        
+        # Error screen
+        self.error_label = pyglet.text.Label('', font_name='Consolas', font_size=18,
+            anchor_x='center', anchor_y='center', multiline=True, width=900,
+            color=(255,150,150,255))
+        
+        # Overlay
+        self.stats_label = pyglet.text.Label('', font_name='Consolas', font_size=14,
+            anchor_x='left', anchor_y='center', color=(240,240,240,255), batch=self.ui_batch)
+        controls = 'LMB: Rotate | RMB: Pan | Scroll: Zoom | +/-: Opacity | 1-9/0: Presets | R: Reset | T/W/G/F'
+        self.controls_label = pyglet.text.Label(controls, font_name='Consolas', font_size=12,
+            x=25, y=27, anchor_x='left', anchor_y='center', color=(220,220,220,255), batch=self.ui_batch)
+        
+        self.layout_labels()
+    
+    def layout_labels(self):
+        """Position labels for window size"""
+        cx, cy = self.window.width // 2, self.window.height // 2
+        self.title_label.position = (cx, cy + 80, 0)
+        self.loading_label.position = (cx, cy, 0)
+        self.info_label.position = (cx, cy - 80, 0)
+        self.error_label.position = (cx, cy, 0)
+        self.stats_label.position = (25, self.window.height - 35, 0)
     
     def load_texture(self, path):
-        """Load texture"""
+        """Decode texture image (no GL calls, runs on the texture thread)"""
         if not path or not os.path.exists(path):
-            return False
+            return None
         try:
             print(f"\nLoading texture: {Path(path).name}")
             img = image.load(path)
-            self.texture = img.get_texture()
-            self.has_texture = True
             print(f"✓ Texture: {img.width}x{img.height}px")
-            return True
+            return img
         except Exception as e:
             print(f"✗ Texture failed: {e}")
-            return False
+            return None
+    
+    def find_and_decode_texture(self):
+        """Texture thread: locate and decode the texture while the model loads"""
+        if self.texture_path:
+            self._texture_image = self.load_texture(self.texture_path)
+        else:
+            self._texture_image = self.auto_find_texture()
+    
+    def upload_texture(self):
+        """Wait for the texture thread, then upload its image (GL thread only)"""
+        self._texture_thread.join()
+        img, self._texture_image = self._texture_image, None
+        if img is None:
+            return
+        self.texture = img.get_texture()
+        self.setup_texture_filtering(self.texture)
+        self.has_texture = True
+    
+    def setup_texture_filtering(self, texture):
+        """Mipmaps plus trilinear/anisotropic filtering for the model texture"""
+        gl = pyglet.gl
+        gl.glBindTexture(texture.target, texture.id)
+        
+        # Generated here, after the upload (pyglet's get_mipmapped_texture
+        # generates them before blitting the image in)
+        gl.glGenerateMipmap(texture.target)
+        gl.glTexParameteri(texture.target, gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR_MIPMAP_LINEAR)
+        gl.glTexParameteri(texture.target, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
+        
+        info = self.window.context.get_info()
+        if (info.have_version(4, 6) or info.have_extension('GL_EXT_texture_filter_anisotropic')
+                or info.have_extension('GL_ARB_texture_filter_anisotropic')):
+            max_aniso = gl.GLfloat()
+            gl.glGetFloatv(gl.GL_MAX_TEXTURE_MAX_ANISOTROPY, max_aniso)
+            gl.glTexParameterf(texture.target, gl.GL_TEXTURE_MAX_ANISOTROPY, min(16.0, max_aniso.value))
+        
+        gl.glBindTexture(texture.target, 0)
     
     def auto_find_texture(self):
         """Auto-find texture"""
@@ -330,12 +1022,13 @@ class UniversalViewer:
         for pattern in [f"{model_name}.*", "texture.*", "diffuse.*"]:
             for tex in model_dir.glob(pattern):
                 if tex.suffix.lower() in formats and tex != Path(self.model_path):
-                    if self.load_texture(str(tex)):
-                        return True
-        return False
+                    img = self.load_texture(str(tex))
+                    if img is not None:
+                        return img
+        return None
     
-    def load_model(self, dt):
-        """Load model (OBJ or GLB)"""
+    def load_model(self):
+        """Read and process the model (background thread, no GL calls)"""
         try:
             self.file_size_mb = os.path.getsize(self.model_path) / (1024**2)
             
@@ -345,112 +1038,72 @@ class UniversalViewer:
             print(f"File: {Path(self.model_path).name}")
             print(f"Size: {self.file_size_mb:.2f} MB")
             
-            # Load texture
-            if self.texture_path:
-                self.loading_stage = "Loading texture..."
-                self.load_texture(self.texture_path)
-            else:
-                self.auto_find_texture()
-            
             # Load model
             self.loading_stage = f"Loading {self.model_format.upper()} file..."
             print(f"\nLoading {self.model_format.upper()} (optimized)...")
             
-            start_time = time.time()
+            start_time = self._load_start
             
-            # GLB is MUCH faster than OBJ (binary format)
-            if self.model_format in ['.glb', '.gltf']:
-                print("Using fast GLB loader...")
-                mesh = trimesh.load(
-                    self.model_path,
-                    force='mesh',
-                    process=False
-                )
+            # Later launches reuse the processed arrays
+            cache_file = mesh_cache_file(self.model_path)
+            packed = load_mesh_cache(cache_file) if cache_file is not None else None
+            if packed is not None:
+                faces = packed.pop('faces')
+                self.face_count = len(faces)
+                print(f"✓ Cached mesh data loaded in {time.time() - start_time:.2f}s")
             else:
-                # OBJ format
-                print("Using OBJ loader...")
-                mesh = trimesh.load(
-                    self.model_path,
-                    force='mesh',
-                    process=False,
-                    skip_materials=True,
-                    validate=False
-                )
-            
-            load_time = time.time() - start_time
-            print(f"✓ Loaded in {load_time:.2f}s")
-            
-            # Handle scene
-            if isinstance(mesh, trimesh.Scene):
-                print(f"Scene with {len(mesh.geometry)} objects, merging...")
-                mesh = trimesh.util.concatenate(list(mesh.geometry.values()))
+                self.loading_stage = "Processing geometry..."
+                packed, faces = self.read_and_process_model(start_time)
+                if cache_file is not None:
+                    # Not a daemon: run() waits for it so no half-written file is left
+                    self._cache_thread = threading.Thread(target=save_mesh_cache,
+                                                          args=(cache_file, {**packed, 'faces': faces}))
+                    self._cache_thread.start()
             
-            print(f"Vertices: {len(mesh.vertices):,}")
-            print(f"Faces: {len(mesh.faces):,}")
-            self.face_count = len(mesh.faces)
+            # GPU-ready buffers; 16-bit indices when every vertex fits
+            vertices = interleave_attributes(packed, self.shader.attributes)
+            indices = np.ascontiguousarray(faces, dtype=np.uint16 if len(vertices) <= 65536 else np.uint32)
+            self.loading_stage = "Uploading to GPU..."
+            self._pending_mesh = (packed, vertices, indices)
             
-            # Process geometry
-            start_proc = time.time()
-            verts = mesh.vertices.astype(np.float32, copy=False)
-            
-            # Center and scale
-            center = verts.mean(axis=0)
-            verts = verts - center
-            max_extent = np.max(np.abs(verts))
-            if max_extent > 0:
-                verts *= (2.0 / max_extent)
-            
-            faces = mesh.faces
-            
-            # Normals
-            if hasattr(mesh, 'vertex_normals') and mesh.vertex_normals is not None:
-                normals = mesh.vertex_normals.astype(np.float32, copy=False)
-            else:
-                print("Computing normals...")
-                normals = np.zeros_like(verts)
-                for face in faces:
-                    v0, v1, v2 = verts[face[0]], verts[face[1]], verts[face[2]]
-                    fn = np.cross(v1 - v0, v2 - v0)
-                    normals[face[0]] += fn
-                    normals[face[1]] += fn
-                    normals[face[2]] += fn
-                norms = np.linalg.norm(normals, axis=1, keepdims=True)
-                norms[norms == 0] = 1
-                normals = normals / norms
-            
-            # Colors
-            if hasattr(mesh.visual, 'vertex_colors') and mesh.visual.vertex_colors is not None:
-                colors = (mesh.visual.vertex_colors[:, :3].astype(np.float32, copy=False) / 255.0)
-            else:
-                colors = np.full((len(verts), 3), 0.75, dtype=np.float32)
-            
-            # UVs
-            if hasattr(mesh.visual, 'uv') and mesh.visual.uv is not None:
-                uvs = mesh.visual.uv.astype(np.float32, copy=False)
-                print("✓ UV mapping")
-            else:
-                uvs = np.zeros((len(verts), 2), dtype=np.float32)
-                print("⚠ No UVs")
-            
-            print(f"Processed in {time.time() - start_proc:.2f}s")
-            
-            # Upload to GPU
-            start_gpu = time.time()
+        except Exception as e:
+            self.report_load_error(e)
+    
+    def report_load_error(self, e):
+        """Show a loading failure on screen and in the console"""
+        self.error_msg = str(e)
+        print(f"\n{'='*70}\n✗ ERROR: {e}\n{'='*70}")
+        import traceback
+        traceback.print_exc()
+    
+    def poll_loading(self, dt):
+        """Loading screen tick: redraw, then upload the model once the thread is done"""
+        try:
+            if self._mesh_upload is None:
+                if self._load_thread.is_alive():
+                    self.redraw(dt)
+                    return
+                if self._pending_mesh is None:  # load_model failed
+                    self.finish_loading()
+                    return
+                
+                # Upload to GPU (texture was found/decoded in the background)
+                self._upload_start = time.time()
+                self.upload_texture()
+                self._mesh_upload = self.upload_mesh(*self._pending_mesh)
             
-            self.vertex_list = self.shader.vertex_list_indexed(
-                len(verts),
-                pyglet.gl.GL_TRIANGLES,
-                faces.flatten().tolist(),
-                position=('f', verts.flatten().tolist()),
-                normal=('f', normals.flatten().tolist()),
-                color=('f', colors.flatten().tolist()),
-                texcoord=('f', uvs.flatten().tolist())
-            )
+            # Upload slices for half a tick, then let the loading screen draw
+            deadline = time.perf_counter() + LOADING_REDRAW_INTERVAL / 2
+            for progress in self._mesh_upload:
+                if time.perf_counter() >= deadline:
+                    self.loading_stage = f"Uploading to GPU... {progress:.0%}"
+                    self.redraw(dt)
+                    return
             
-            self.vertex_count = len(verts)
-            print(f"GPU upload: {time.time() - start_gpu:.2f}s")
+            self.vertex_count = len(self._pending_mesh[1])
+            print(f"GPU upload: {time.time() - self._upload_start:.2f}s ({self.vertex_bytes} bytes/vertex)")
             
-            total = time.time() - start_time
+            total = time.time() - self._load_start
             
             self.loaded = True
             print(f"\n{'='*70}")
@@ -467,13 +1120,179 @@ class UniversalViewer:
             print(f"  R: Reset | T: Texture | W: Wire | G: Grid | F: Full | ESC: Exit")
             
         except Exception as e:
-            self.error_msg = str(e)
-            print(f"\n{'='*70}\n✗ ERROR: {e}\n{'='*70}")
-            import traceback
-            traceback.print_exc()
+            self.report_load_error(e)
+        
+        self.finish_loading()
+    
+    def finish_loading(self):
+        """Stop the loading timer and drop the staging arrays"""
+        pyglet.clock.unschedule(self.poll_loading)
+        self._pending_mesh = self._mesh_upload = None
+        self.request_redraw()
+    
+    def read_and_process_model(self, start_time):
+        """Parse the model file and turn it into quantized vertex attributes and faces"""
+        # GLB: read the binary chunk directly when the layout allows it
+        arrays = None
+        if self.model_format == '.glb':
+            try:
+                arrays = read_glb_arrays(self.model_path)
+            except Exception as e:
+                print(f"⚠ Direct GLB read failed ({e}), using trimesh")
+            if arrays is not None:
+                print("Using direct GLB reader...")
+        
+        if arrays is None:
+            # GLB is MUCH faster than OBJ (binary format)
+            if self.model_format in ['.glb', '.gltf']:
+                print("Using fast GLB loader...")
+                mesh = trimesh.load(
+                    self.model_path,
+                    force='mesh',
+                    process=False
+                )
+            else:
+                # OBJ format
+                print("Using OBJ loader...")
+                mesh = trimesh.load(
+                    self.model_path,
+                    force='mesh',
+                    process=False,
+                    skip_materials=True,
+                    validate=False
+                )
+            
+            # Handle scene: merge the raw arrays, skipping trimesh's visual merging
+            if isinstance(mesh, trimesh.Scene):
+                print(f"Scene with {len(mesh.geometry)} objects, merging...")
+                arrays = merge_mesh_arrays([mesh_arrays(geometry) for geometry in mesh.geometry.values()])
+            else:
+                arrays = mesh_arrays(mesh)
+        
+        load_time = time.time() - start_time
+        print(f"✓ Loaded in {load_time:.2f}s")
+        
+        faces = np.ascontiguousarray(arrays['faces'], dtype=np.uint32)
+        print(f"Vertices: {len(arrays['vertices']):,}")
+        print(f"Faces: {len(faces):,}")
+        self.face_count = len(faces)
+        
+        # Process geometry
+        start_proc = time.time()
+        # Center and scale (also converts to float32)
+        verts = center_and_scale(arrays['vertices'])
+        
+        # Normals
+        if arrays['normals'] is not None:
+            normals = arrays['normals'].astype(np.float32, copy=False)
+        else:
+            print("Computing normals...")
+            normals = compute_vertex_normals(verts, faces)
+        
+        # Colors
+        if arrays['colors'] is not None:
+            colors = arrays['colors'].astype(np.uint8, copy=False)
+        else:
+            colors = np.full((len(verts), 3), 191, dtype=np.uint8)  # 0.75 gray
+        
+        # UVs
+        if arrays['uvs'] is not None:
+            uvs = arrays['uvs']
+            print("✓ UV mapping")
+        else:
+            uvs = np.zeros((len(verts), 2), dtype=np.float32)
+            print("⚠ No UVs")
+        
+        print(f"Processed in {time.time() - start_proc:.2f}s")
+        return quantize_attributes(verts, normals, colors, uvs), faces
+    
+    def upload_mesh(self, packed, vertices, indices):
+        """
+        Upload the interleaved vertices and indices straight from NumPy memory.
+        Generator: copies one slice per step and yields the fraction done.
+        """
+        gl = pyglet.gl
+        
+        self.mesh_vao = gl.GLuint()
+        gl.glGenVertexArrays(1, self.mesh_vao)
+        gl.glBindVertexArray(self.mesh_vao)
+        
+        # Allocate both buffers and record the attribute layout up front
+        layout = vertices.dtype
+        vbo = gl.GLuint()
+        gl.glGenBuffers(1, vbo)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, None, gl.GL_STATIC_DRAW)
+        self.mesh_buffers.append(vbo)
+        self.vertex_bytes = layout.itemsize
+        
+        for name in layout.names:
+            data = packed[name]
+            location = self.shader.attributes[name]['location']
+            normalized = gl.GL_FALSE if data.dtype.kind == 'f' else gl.GL_TRUE
+            gl.glEnableVertexAttribArray(location)
+            gl.glVertexAttribPointer(location, data.shape[1], VERTEX_GL_TYPES[data.dtype], normalized,
+                                     layout.itemsize, layout.fields[name][1])
+        
+        # Index buffer (element binding is recorded in the VAO)
+        self.index_type = gl.GL_UNSIGNED_SHORT if indices.dtype == np.uint16 else gl.GL_UNSIGNED_INT
+        ebo = gl.GLuint()
+        gl.glGenBuffers(1, ebo)
+        gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, ebo)
+        gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, None, gl.GL_STATIC_DRAW)
+        self.mesh_buffers.append(ebo)
+        self.index_count = indices.size
+        
+        gl.glBindVertexArray(0)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+        
+        # Fill them through the copy-write target, which no VAO or pyglet
+        # draw depends on, so frames can be drawn between slices
+        total = vertices.nbytes + indices.nbytes
+        done = 0
+        for buffer, data in ((vbo, vertices), (ebo, indices)):
+            raw = data.reshape(-1).view(np.uint8)
+            for offset in range(0, raw.size, UPLOAD_CHUNK_BYTES):
+                chunk = raw[offset:offset + UPLOAD_CHUNK_BYTES]
+                gl.glBindBuffer(gl.GL_COPY_WRITE_BUFFER, buffer)
+                gl.glBufferSubData(gl.GL_COPY_WRITE_BUFFER, offset, chunk.nbytes, chunk.ctypes.data)
+                gl.glBindBuffer(gl.GL_COPY_WRITE_BUFFER, 0)
+                done += chunk.nbytes
+                yield done / total
+    
+    def draw_mesh(self):
+        """Draw the uploaded model"""
+        pyglet.gl.glBindVertexArray(self.mesh_vao)
+        pyglet.gl.glDrawElements(pyglet.gl.GL_TRIANGLES, self.index_count, self.index_type, 0)
+        pyglet.gl.glBindVertexArray(0)
+    
+    def request_redraw(self):
+        """Schedule one repaint on the next loop iteration (coalesces bursts of events)"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            pyglet.clock.schedule_once(self.redraw, 0)
+    
+    def redraw(self, dt):
+        """Repaint the window now"""
+        self._redraw_pending = False
+        if self.window.context:  # closed windows have no GL context left
+            self.window.draw(dt)
+    
+    def update_matrices(self):
+        """Rebuild projection/view only after a resize or camera change"""
+        if self._projection_dirty:
+            self._projection_dirty = False
+            aspect = self.window.width / max(1, self.window.height)
+            self.projection = Mat4.perspective_projection(aspect, 45, 0.1, 100.0)
+            self.projection_2d = Mat4.orthogonal_projection(0, self.window.width, 0, self.window.height, -1, 1)
+        
+        if self._view_dirty:
+            self._view_dirty = False
+            self.view = make_view_matrix(self.rot_x, self.rot_y, self.distance, self.pan_x, self.pan_y)
     
     def draw(self):
         """Main render"""
+        self.set_depth_mask(True)  # glClear honours the depth mask
         pyglet.gl.glClear(pyglet.gl.GL_COLOR_BUFFER_BIT | pyglet.gl.GL_DEPTH_BUFFER_BIT)
         
         if self.error_msg:
@@ -484,16 +1303,14 @@ class UniversalViewer:
             self.draw_loading()
             return
         
-        aspect = self.window.width / self.window.height
-        projection = Mat4.perspective_projection(aspect, 45, 0.1, 100.0)
-        view = Mat4()
-        view = view.translate(Vec3(self.pan_x, self.pan_y, -self.distance))
-        view = view.rotate(self.rot_x * 0.01745329, Vec3(1, 0, 0))
-        view = view.rotate(self.rot_y * 0.01745329, Vec3(0, 1, 0))
-        model = Mat4()
+        self.update_matrices()
+        projection, view, model = self.projection, self.view, self.model_matrix
+        
+        self.set_enabled(pyglet.gl.GL_DEPTH_TEST, True)
+        self.set_enabled(pyglet.gl.GL_BLEND, True)
         
         if self.show_grid:
-            self.draw_grid(projection, view, model)
+            self.draw_grid(projection, view)
         
         self.shader.use()
         self.shader['projection'] = projection
@@ -504,93 +1321,66 @@ class UniversalViewer:
         self.shader['view_pos'] = (self.pan_x, self.pan_y, self.distance)
         self.shader['opacity'] = self.opacity
         
-        if self.opacity < 1.0:
-            pyglet.gl.glDisable(pyglet.gl.GL_CULL_FACE)
-            pyglet.gl.glDepthMask(pyglet.gl.GL_FALSE)
-        else:
-            pyglet.gl.glEnable(pyglet.gl.GL_CULL_FACE)
-            pyglet.gl.glDepthMask(pyglet.gl.GL_TRUE)
+        # Transparent models show their back faces and don't occlude themselves
+        opaque = self.opacity >= 1.0
+        self.set_enabled(pyglet.gl.GL_CULL_FACE, opaque)
+        self.set_depth_mask(opaque)
         
         if self.has_texture and self.texture:
             pyglet.gl.glActiveTexture(pyglet.gl.GL_TEXTURE0)
             pyglet.gl.glBindTexture(pyglet.gl.GL_TEXTURE_2D, self.texture.id)
             self.shader['tex'] = 0
         
-        if self.show_wireframe:
-            pyglet.gl.glPolygonMode(pyglet.gl.GL_FRONT_AND_BACK, pyglet.gl.GL_LINE)
-        
-        self.vertex_list.draw(pyglet.gl.GL_TRIANGLES)
-        
-        pyglet.gl.glPolygonMode(pyglet.gl.GL_FRONT_AND_BACK, pyglet.gl.GL_FILL)
-        pyglet.gl.glEnable(pyglet.gl.GL_CULL_FACE)
-        pyglet.gl.glDepthMask(pyglet.gl.GL_TRUE)
+        self.set_polygon_mode(pyglet.gl.GL_LINE if self.show_wireframe else pyglet.gl.GL_FILL)
+        self.draw_mesh()
+        self.set_polygon_mode(pyglet.gl.GL_FILL)
         
         self.draw_ui()
     
-    def draw_grid(self, projection, view, model):
+    def draw_grid(self, projection, view):
         """Draw grid"""
-        pyglet.gl.glDepthMask(pyglet.gl.GL_FALSE)
-        self.grid_shader.use()
-        self.grid_shader['projection'] = projection
-        self.grid_shader['view'] = view
-        self.grid_shader['model'] = model
+        self.set_depth_mask(False)
+        self.flat_shader.use()
+        self.flat_shader['projection'] = projection
+        self.flat_shader['view'] = view
         self.grid_vertex_list.draw(pyglet.gl.GL_LINES)
-        pyglet.gl.glDepthMask(pyglet.gl.GL_TRUE)
     
     def draw_loading(self):
         """Loading screen"""
-        pyglet.gl.glDisable(pyglet.gl.GL_DEPTH_TEST)
-        
-        pyglet.text.Label('Loading 3D Model', font_name='Consolas', font_size=26,
-            x=self.window.width//2, y=self.window.height//2+80,
-            anchor_x='center', anchor_y='center', color=(255,255,255,255)).draw()
-        
-        pyglet.text.Label(self.loading_stage, font_name='Consolas', font_size=18,
-            x=self.window.width//2, y=self.window.height//2,
-            anchor_x='center', anchor_y='center', color=(220,220,220,255)).draw()
+        self.set_enabled(pyglet.gl.GL_DEPTH_TEST, False)
         
+        set_label_text(self.loading_label, self.loading_stage)
         if self.file_size_mb > 0:
-            pyglet.text.Label(f'Size: {self.file_size_mb:.1f} MB', font_name='Consolas', font_size=14,
-                x=self.window.width//2, y=self.window.height//2-80,
-                anchor_x='center', anchor_y='center', color=(180,180,180,255)).draw()
-        
-        pyglet.gl.glEnable(pyglet.gl.GL_DEPTH_TEST)
+            set_label_text(self.info_label, f'Size: {self.file_size_mb:.1f} MB')
+        self.draw_text(self.loading_batch)
     
     def draw_error(self):
         """Error screen"""
-        pyglet.gl.glDisable(pyglet.gl.GL_DEPTH_TEST)
-        pyglet.text.Label(f'ERROR:\n\n{self.error_msg}', font_name='Consolas', font_size=18,
-            x=self.window.width//2, y=self.window.height//2,
-            anchor_x='center', anchor_y='center', multiline=True, width=900,
-            color=(255,150,150,255)).draw()
-        pyglet.gl.glEnable(pyglet.gl.GL_DEPTH_TEST)
+        self.set_enabled(pyglet.gl.GL_DEPTH_TEST, False)
+        set_label_text(self.error_label, f'ERROR:\n\n{self.error_msg}')
+        self.draw_text(self.error_label)
     
     def draw_ui(self):
         """UI overlay"""
-        pyglet.gl.glDisable(pyglet.gl.GL_DEPTH_TEST)
+        self.set_enabled(pyglet.gl.GL_DEPTH_TEST, False)
         
-        projection_2d = Mat4.orthogonal_projection(0, self.window.width, 0, self.window.height, -1, 1)
-        self.ui_shader.use()
-        self.ui_shader['projection'] = projection_2d
-        self.ui_shader['color'] = (0.0, 0.0, 0.0, 0.75)
-        self.ui_bg_top.draw(pyglet.gl.GL_TRIANGLES)
-        self.ui_bg_bottom.draw(pyglet.gl.GL_TRIANGLES)
+        self.flat_shader.use()
+        self.flat_shader['projection'] = self.projection_2d
+        self.flat_shader['view'] = IDENTITY
+        self.ui_bg.draw(pyglet.gl.GL_TRIANGLES)
         
-        stats = (f'Vertices: {self.vertex_count:,} | Faces: {self.face_count:,} | '
-                 f'Zoom: {self.distance:.1f}x | Opacity: {int(self.opacity*100)}% | '
-                 f'Texture: {"ON" if self.has_texture else "OFF"} | '
-                 f'Wire: {"ON" if self.show_wireframe else "OFF"} | Grid: {"ON" if self.show_grid else "OFF"}')
+        # Only re-layout the stats text when a displayed value changed
+        stats_state = (self.vertex_count, self.face_count, round(self.distance, 1), int(self.opacity*100),
+                       self.has_texture, self.show_wireframe, self.show_grid)
+        if stats_state != self._last_stats:
+            self._last_stats = stats_state
+            self.stats_label.text = (
+                f'Vertices: {self.vertex_count:,} | Faces: {self.face_count:,} | '
+                f'Zoom: {self.distance:.1f}x | Opacity: {int(self.opacity*100)}% | '
+                f'Texture: {"ON" if self.has_texture else "OFF"} | '
+                f'Wire: {"ON" if self.show_wireframe else "OFF"} | Grid: {"ON" if self.show_grid else "OFF"}')
         
-        pyglet.text.Label(stats, font_name='Consolas', font_size=14,
-            x=25, y=self.window.height-35, anchor_x='left', anchor_y='center',
-            color=(240,240,240,255)).draw()
-        
-        controls = 'LMB: Rotate | RMB: Pan | Scroll: Zoom | +/-: Opacity | 1-9/0: Presets | R: Reset | T/W/G/F'
-        pyglet.text.Label(controls, font_name='Consolas', font_size=12,
-            x=25, y=27, anchor_x='left', anchor_y='center',
-            color=(220,220,220,255)).draw()
-        
-        pyglet.gl.glEnable(pyglet.gl.GL_DEPTH_TEST)
+        self.draw_text(self.ui_batch)
     
     def on_drag(self, x, y, dx, dy, buttons, mods):
         if buttons & mouse.LEFT:
@@ -599,18 +1389,24 @@ class UniversalViewer:
         elif buttons & mouse.RIGHT:
             self.pan_x += dx * 0.01 * (self.distance / 5)
             self.pan_y += dy * 0.01 * (self.distance / 5)
+        self._view_dirty = True
+        self.request_redraw()
     
     def on_scroll(self, x, y, sx, sy):
         self.distance -= sy * 0.3
         self.distance = max(1.0, min(50, self.distance))
+        self._view_dirty = True
+        self.request_redraw()
     
     def on_key(self, symbol, mods):
         if symbol == key.ESCAPE:
             self.window.close()
+            return
         elif symbol == key.R:
             self.rot_x = self.rot_y = 20.0
             self.distance = 5.0
             self.pan_x = self.pan_y = 0.0
+            self._view_dirty = True
         elif symbol == key.F:
             self.window.set_fullscreen(not self.window.fullscreen)
         elif symbol == key.T and self.texture:
@@ -627,16 +1423,36 @@ class UniversalViewer:
             self.opacity = int(chr(symbol)) / 10.0
         elif symbol == key._0:
             self.opacity = 1.0
+        self.request_redraw()
     
     def on_resize(self, width, height):
         pyglet.gl.glViewport(0, 0, width, height)
+        self._projection_dirty = True
         self.update_ui_backgrounds()
+        self.layout_labels()
+        self.request_redraw()
     
     def run(self):
-        pyglet.app.run()
+        pyglet.app.run(None)  # no fixed-rate redraws, see request_redraw
+        
+        if self._cache_thread is not None and self._cache_thread.is_alive():
+            print("Finishing mesh cache write...")
+            self._cache_thread.join()
+
+
+def wait_for_launch():
+    """Pre-warmed mode: libraries are imported, wait for the viewer arguments"""
+    line = sys.stdin.readline()
+    if not line:
+        return False  # GUI closed before using this viewer
+    sys.argv = [sys.argv[0]] + json.loads(line)
+    return True
 
 
 def main():
+    if sys.argv[1:2] == ['--warm'] and not wait_for_launch():
+        return
+    
     print("\n" + "="*70)
     print("Universal 3D Viewer - OBJ & GLB Support")
     print("="*70)
@@ -660,12 +1476,12 @@ def main():
         if not model_path:
             print("ERROR: No model found!")
             print(f"Usage: python {sys.argv[0]} <model.obj|glb> [texture.png]")
-            input("\nPress Enter to exit...")
+            pause_before_exit()
             return
     
     if not os.path.exists(model_path):
         print(f"ERROR: File not found: {model_path}")
-        input("\nPress Enter to exit...")
+        pause_before_exit()
         return
     
     if texture_path and not os.path.exists(texture_path):
@@ -685,4 +1501,4 @@ if __name__ == '__main__':
         print(f"\n{'='*70}\nFATAL ERROR\n{'='*70}\n{e}\n")
         import traceback
         traceback.print_exc()
-        input("\nPress Enter to exit...")
+        pause_before_exit()